@@ -7,16 +7,438 @@ Supports C/C++, Python, JavaScript/TypeScript, and MQL5 codebases.
 """
 
 import asyncio
-import json
+import fnmatch
+import hashlib
+import os
+import mmap
+import multiprocessing
+import re
+import sqlite3
 import sys
+import threading
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import orjson
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, Iterator, List, Any, Optional
 import logging
 
+# Optional NumPy acceleration for the newline-offset scan
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional multi-pattern regex engines for glob matching (see requirements.txt).
+# Falls back to a single stdlib ``re`` alternation when neither is installed.
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional C-accelerated Aho-Corasick automaton for language detection
+# (see requirements.txt). Falls back to a single compiled alternation.
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional tree-sitter backend for AST-accurate entity extraction
+# (see requirements.txt). Falls back to line-based extraction when absent.
+try:
+    import tree_sitter
+    from tree_sitter_languages import get_parser
+    TREE_SITTER_AVAILABLE = True
+except ImportError:
+    TREE_SITTER_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("code-analysis-server")
 
+# Unified entity queries per language: each capture is named either
+# "class.name" or "function.name" so extraction is language-agnostic.
+TS_ENTITY_QUERIES = {
+    "python": """
+        (class_definition name: (identifier) @class.name)
+        (function_definition name: (identifier) @function.name)
+    """,
+    "cpp": """
+        (class_specifier name: (type_identifier) @class.name)
+        (struct_specifier name: (type_identifier) @class.name)
+        (function_definition
+            declarator: (function_declarator
+                declarator: (identifier) @function.name))
+        (function_definition
+            declarator: (function_declarator
+                declarator: (qualified_identifier) @function.name))
+    """,
+    "javascript": """
+        (class_declaration name: (identifier) @class.name)
+        (function_declaration name: (identifier) @function.name)
+        (method_definition name: (property_identifier) @function.name)
+    """
+}
+
+# Signature substrings per language, with the minimum confidence each
+# language needs before detection accepts it
+LANGUAGE_PATTERNS = {
+    "cpp": ["#include", "std::", "namespace", "class ", "public:", "private:"],
+    "python": ["def ", "import ", "from ", "class ", "self.", "print(", "__init__"],
+    "javascript": ["function ", "const ", "let ", "var ", "console.log", "=> {", "export ", "import "],
+    "mql5": ["int OnInit", "void OnTick", "double ", "#property", "MQL5"]
+}
+# Extension to language map, hoisted so the hot detection path does a single
+# dict lookup instead of rebuilding the literal per call
+_EXT_MAP = {
+    ".cpp": "cpp", ".hpp": "cpp", ".cc": "cpp", ".cxx": "cpp",
+    ".py": "python",
+    ".js": "javascript", ".ts": "javascript", ".jsx": "javascript",
+    ".mq5": "mql5"
+}
+
+
+def _newline_index(content) -> List[int]:
+    """
+    Offsets of every newline in the buffer, sorted ascending.
+
+    Built once per file so match positions translate to line numbers via
+    bisect in O(log N) instead of an O(N) newline count per match. The scan
+    itself is vectorized by NumPy when available and otherwise runs as
+    C-level find calls; both accept bytes and mmap buffers.
+    """
+    if NUMPY_AVAILABLE and not isinstance(content, mmap.mmap):
+        arr = np.frombuffer(content, dtype=np.uint8)
+        return np.flatnonzero(arr == 10).tolist()
+
+    offsets = []
+    pos = content.find(b'\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find(b'\n', pos + 1)
+    return offsets
+
+
+# Interned hot-field constants: one shared PyUnicode per value instead of a
+# fresh copy in every entity row
+_T_CLASS = sys.intern("class")
+_T_FUNCTION = sys.intern("function")
+_T_EVENT_HANDLER = sys.intern("event_handler")
+_L_CPP = sys.intern("cpp")
+_L_PYTHON = sys.intern("python")
+_L_JAVASCRIPT = sys.intern("javascript")
+_L_MQL5 = sys.intern("mql5")
+_SCOPE_GLOBAL = sys.intern("global")
+
+# Prebuilt prefixes for synthetic C++ function ids: prefix + str(line) avoids
+# two f-string formatting passes per emitted entity
+_FN_LINE_PREFIX = "function_line_"
+_FN_AT_LINE_PREFIX = "function_at_line_"
+
+# Files above this size are skipped during codebase walks; source files this
+# large are almost always generated or minified bundles
+MAX_FILE_BYTES = 16 * 1024 * 1024
+
+
+class LanguageDetector:
+    """
+    Detects the programming language of a content sample in a single pass.
+
+    All signature substrings are loaded into one Aho-Corasick automaton
+    (or one compiled regex alternation as fallback), so the sample is walked
+    exactly once regardless of how many patterns exist.
+    """
+
+    def __init__(self, patterns: Dict[str, List[str]] = LANGUAGE_PATTERNS):
+        self._patterns = patterns
+
+        # Some substrings (e.g. "class ") belong to several languages
+        word_langs: Dict[str, List[str]] = {}
+        for lang, words in patterns.items():
+            for word in words:
+                word_langs.setdefault(word, []).append(lang)
+        self._word_langs = word_langs
+
+        self._automaton = None
+        self._regex = None
+
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for word, langs in word_langs.items():
+                automaton.add_word(word, (word, langs))
+            automaton.make_automaton()
+            self._automaton = automaton
+        else:
+            alternation = "|".join(re.escape(w) for w in word_langs)
+            self._regex = re.compile(alternation)
+
+    def detect(self, content: str) -> tuple[str, float, List[str]]:
+        """Return (language, confidence, matched_patterns) for a sample."""
+        hits: Dict[str, set] = {}
+
+        if self._automaton is not None:
+            matches = (value for _, value in self._automaton.iter(content))
+        else:
+            seen = {m.group() for m in self._regex.finditer(content)}
+            matches = ((word, self._word_langs[word]) for word in seen)
+
+        for word, langs in matches:
+            for lang in langs:
+                hits.setdefault(lang, set()).add(word)
+
+        # Any single distinctive hit decides, first language in declaration
+        # order winning ties — the same accept-on-any-hit semantics as the
+        # original per-pattern scan
+        for lang in self._patterns:
+            matched = hits.get(lang)
+            if matched:
+                ordered = [w for w in self._patterns[lang] if w in matched]
+                return lang, 1.0, ordered
+
+        return "unknown", 0.0, []
+
+
+class EntityTable:
+    """
+    Column-oriented (SoA) entity storage.
+
+    Each entity field lives in its own column list instead of a 7-key dict
+    per entity, cutting per-entity memory overhead by roughly an order of
+    magnitude and keeping aggregation cache-friendly. File paths are
+    deduplicated into a small table referenced by index. Row dicts are only
+    materialized at the JSON boundary via rows()/to_rows().
+    """
+
+    __slots__ = ('ids', 'names', 'types', 'langs', 'file_ids', 'lines',
+                 'scopes', 'files', '_file_index')
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.types: List[str] = []
+        self.langs: List[str] = []
+        self.file_ids: List[int] = []
+        self.lines: List[int] = []
+        self.scopes: List[str] = []
+        self.files: List[str] = []
+        self._file_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def file_id(self, path: str) -> int:
+        """Intern a file path into the table, returning its index."""
+        idx = self._file_index.get(path)
+        if idx is None:
+            idx = len(self.files)
+            self.files.append(path)
+            self._file_index[path] = idx
+        return idx
+
+    def append(self, entity_id: str, name: str, entity_type: str,
+               language: str, file_id: int, line: int, scope: str = _SCOPE_GLOBAL):
+        """Append one entity as column values."""
+        self.ids.append(entity_id)
+        self.names.append(name)
+        self.types.append(entity_type)
+        self.langs.append(language)
+        self.file_ids.append(file_id)
+        self.lines.append(line)
+        self.scopes.append(scope)
+
+    def extend(self, other: "EntityTable"):
+        """Merge another table into this one, remapping its file indices."""
+        remap = [self.file_id(p) for p in other.files]
+        self.ids += other.ids
+        self.names += other.names
+        self.types += other.types
+        self.langs += other.langs
+        self.file_ids += [remap[i] for i in other.file_ids]
+        self.lines += other.lines
+        self.scopes += other.scopes
+
+    def rows(self) -> Iterator[Dict]:
+        """Lazily materialize row dicts for serialization."""
+        files = self.files
+        for i in range(len(self.ids)):
+            yield {
+                "id": self.ids[i],
+                "name": self.names[i],
+                "type": self.types[i],
+                "language": self.langs[i],
+                "file": files[self.file_ids[i]],
+                "line": self.lines[i],
+                "scope": self.scopes[i]
+            }
+
+    def to_rows(self) -> List[Dict]:
+        """Materialize all rows, for JSON responses."""
+        return list(self.rows())
+
+    def columns(self) -> Dict[str, List]:
+        """Columnar view, used for compact cache serialization."""
+        return {
+            "id": self.ids,
+            "name": self.names,
+            "type": self.types,
+            "language": self.langs,
+            "file_id": self.file_ids,
+            "line": self.lines,
+            "scope": self.scopes,
+            "files": self.files
+        }
+
+    @classmethod
+    def from_columns(cls, cols: Dict[str, List]) -> "EntityTable":
+        """Rebuild a table from its columnar view."""
+        table = cls()
+        table.ids = cols["id"]
+        table.names = cols["name"]
+        # Re-intern the highly repetitive columns on load so cached tables
+        # share the same constants as freshly extracted ones
+        table.types = [sys.intern(t) for t in cols["type"]]
+        table.langs = [sys.intern(lang) for lang in cols["language"]]
+        table.file_ids = cols["file_id"]
+        table.lines = cols["line"]
+        table.scopes = [sys.intern(s) for s in cols["scope"]]
+        table.files = cols["files"]
+        table._file_index = {p: i for i, p in enumerate(table.files)}
+        return table
+
+    @classmethod
+    def from_rows(cls, rows: List[Dict]) -> "EntityTable":
+        """Build a table from legacy row-dict lists (e.g. old cache entries)."""
+        table = cls()
+        for row in rows:
+            table.append(row["id"], row["name"], sys.intern(row["type"]),
+                         sys.intern(row["language"]), table.file_id(row["file"]),
+                         row["line"], sys.intern(row["scope"]))
+        return table
+
+
+# Shared on-disk cache location for parsed ASTs
+AST_CACHE_PATH = Path(os.path.expanduser("~/.cache/holytree/ast.db"))
+
+
+class ASTCache:
+    """
+    Persistent per-file entity/relationship cache keyed by (path, sha256).
+
+    Warm analyses only re-parse files whose content hash changed; everything
+    else is served from SQLite. The connection is opened lazily so pool
+    workers each get their own handle, and WAL mode keeps concurrent
+    writers from blocking each other.
+    """
+
+    def __init__(self, db_path: Path = AST_CACHE_PATH):
+        self._db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn_pid != os.getpid():
+            # A connection inherited across fork must not be shared with
+            # the parent; reopen in the child
+            self._conn = None
+            self._conn_pid = os.getpid()
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self._db_path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS ast("
+                "path TEXT, sha BLOB, entities BLOB, rels BLOB, "
+                "PRIMARY KEY(path, sha))")
+        return self._conn
+
+    def get(self, path: str, sha: bytes) -> Optional[tuple]:
+        """Return cached (entities, relationships) or None on miss."""
+        try:
+            row = self._connect().execute(
+                "SELECT entities, rels FROM ast WHERE path=? AND sha=?",
+                (path, sha)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"AST cache read failed for {path}: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        entities = orjson.loads(row[0])
+        if isinstance(entities, list):
+            # Entry written before the columnar format
+            table = EntityTable.from_rows(entities)
+        else:
+            table = EntityTable.from_columns(entities)
+        return table, orjson.loads(row[1])
+
+    def put(self, path: str, sha: bytes, entities: EntityTable, relationships: List[Dict]):
+        """Store extraction results for a file revision."""
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO ast(path, sha, entities, rels) VALUES(?,?,?,?)",
+                (path, sha, orjson.dumps(entities.columns()), orjson.dumps(relationships)))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"AST cache write failed for {path}: {e}")
+
+
+class GlobSetMatcher:
+    """
+    Matches a path against a set of glob patterns in a single pass.
+
+    All patterns are translated via ``fnmatch.translate`` and compiled once
+    into one multi-pattern database, so match cost is independent of pattern
+    count. Prefers Hyperscan, then re2, then a stdlib ``re`` alternation.
+    """
+
+    def __init__(self, patterns: List[str]):
+        regexes = [fnmatch.translate(p) for p in patterns]
+        self._hs_db = None
+        self._regex = None
+
+        if not regexes:
+            return
+
+        if HYPERSCAN_AVAILABLE:
+            try:
+                db = hyperscan.Database()
+                db.compile(expressions=[r.encode() for r in regexes],
+                           ids=list(range(len(regexes))),
+                           flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(regexes))
+                self._hs_db = db
+                return
+            except Exception as e:
+                logger.debug(f"Hyperscan compile failed, falling back: {e}")
+
+        alternation = "|".join(f"(?:{r})" for r in regexes)
+        engine = re2 if RE2_AVAILABLE else re
+        self._regex = engine.compile(alternation)
+
+    def matches(self, text: str) -> bool:
+        """Return True if any pattern matches the given text."""
+        if self._hs_db is not None:
+            matched = []
+            self._hs_db.scan(text.encode(),
+                             match_event_handler=lambda *args: matched.append(True))
+            return bool(matched)
+        if self._regex is not None:
+            return self._regex.match(text) is not None
+        return False
+
+
 class CodeAnalysisServer:
     """
     MCP server providing code analysis and entity extraction capabilities.
@@ -25,6 +447,17 @@ class CodeAnalysisServer:
     supporting the Ingestion_Pipeline/Entity_Extractor component.
     """
 
+    # Precompiled byte patterns for the fallback extractors: one C-level
+    # finditer pass per file instead of a Python loop over split lines.
+    # Alternations capture group 1 = class name, group 2 = function name.
+    _PY_ENTITY_RE = re.compile(rb'^[ \t]*(?:class[ \t]+(\w+)|def[ \t]+(\w+))', re.M)
+    _JS_ENTITY_RE = re.compile(rb'^[ \t]*(?:class[ \t]+(\w+)|function[ \t]+(\w+))', re.M)
+    _CPP_CLASS_RE = re.compile(rb'^[ \t]*class[ \t]+(\w+)', re.M)
+    # Same heuristic as the old line loop: any non-comment line containing a
+    # space and a parenthesized argument list
+    _CPP_FUNCTION_RE = re.compile(rb'^(?![ \t]*//)[^\n]* [^\n]*\([^\n]*\)', re.M)
+    _MQL5_HANDLER_RE = re.compile(rb'^[ \t]*(?:int|void|double)[ \t]+(OnInit|OnTick|OnDeinit)[ \t]*\(', re.M)
+
     def __init__(self):
         self.supported_languages = {
             "cpp": "C/C++",
@@ -33,8 +466,30 @@ class CodeAnalysisServer:
             "mql5": "MQL5"
         }
 
-        logger.info("CodeAnalysisServer MCP initialized with support for: %s",
-                   ", ".join(self.supported_languages.values()))
+        # Lazily-built {language: (parser, query)} dispatch table
+        self._ts_backends: Dict[str, Any] = {}
+
+        # Compiled glob matchers, keyed by pattern tuple so repeat analyses
+        # with the same patterns reuse the compiled database
+        self._matcher_cache: Dict[tuple, GlobSetMatcher] = {}
+
+        # Persistent AST cache: warm runs only re-parse changed files
+        self._ast_cache = ASTCache()
+
+        # One-pass multi-pattern language detector
+        self._lang_detector = LanguageDetector()
+
+        # Tool dispatch table: one dict lookup per call instead of an
+        # if/elif chain over the tool name
+        self._tools = {
+            "analyze_codebase": self.analyze_codebase,
+            "extract_file_entities": self.extract_file_entities,
+            "detect_language": self.detect_language,
+        }
+
+        logger.info("CodeAnalysisServer MCP initialized with support for: %s (tree-sitter: %s)",
+                   ", ".join(self.supported_languages.values()),
+                   "enabled" if TREE_SITTER_AVAILABLE else "unavailable, using line-based fallback")
 
     async def handle_call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -48,14 +503,10 @@ class CodeAnalysisServer:
             Tool execution results
         """
         try:
-            if name == "analyze_codebase":
-                return await self.analyze_codebase(arguments)
-            elif name == "extract_file_entities":
-                return await self.extract_file_entities(arguments)
-            elif name == "detect_language":
-                return await self.detect_language(arguments)
-            else:
+            handler = self._tools.get(name)
+            if handler is None:
                 raise ValueError(f"Unknown tool: {name}")
+            return await handler(arguments)
 
         except Exception as e:
             logger.error(f"Error executing tool {name}: {e}")
@@ -74,6 +525,37 @@ class CodeAnalysisServer:
         Returns:
             Dictionary with extracted entities and relationships
         """
+        all_entities = EntityTable()
+        all_relationships = []
+        files_processed = 0
+
+        async for batch in self.analyze_codebase_stream(args):
+            files_processed += 1
+            all_entities.extend(batch["entities"])
+            all_relationships.extend(batch["relationships"])
+
+        logger.info(f"Analysis complete: {len(all_entities)} entities, {len(all_relationships)} relationships")
+
+        return {
+            "success": True,
+            "entities": all_entities.to_rows(),
+            "relationships": all_relationships,
+            "summary": {
+                "total_files_processed": files_processed,
+                "total_entities": len(all_entities),
+                "total_relationships": len(all_relationships)
+            }
+        }
+
+    async def analyze_codebase_stream(self, args: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream per-file entity batches as extraction completes.
+
+        Yields one {"file", "entities", "relationships"} dict per processed
+        file, with "entities" as a columnar EntityTable. The in-flight set is capped at 2x cpu_count so memory stays
+        constant regardless of codebase size, and downstream consumers can
+        start indexing while later files are still being parsed.
+        """
         path = args["path"]
         languages = args.get("languages", ["cpp", "python", "javascript"])
         include_patterns = args.get("include_patterns", ["*.cpp", "*.hpp", "*.py", "*.js", "*.mq5"])
@@ -81,41 +563,102 @@ class CodeAnalysisServer:
 
         logger.info(f"Analyzing codebase at {path} with languages: {languages}")
 
-        all_entities = []
-        all_relationships = []
-
-        # Implement recursive directory traversal
         root_path = Path(path)
         if not root_path.exists():
             raise FileNotFoundError(f"Path does not exist: {path}")
 
-        # Scan for files matching patterns
-        for file_path in self._find_files_recursively(root_path, include_patterns, exclude_patterns):
-            try:
-                # Detect language for this file
-                language = await self._detect_file_language(file_path)
-
-                if language in languages:
-                    # Extract entities from this file
-                    entities, relationships = await self._extract_entities_from_file(file_path, language)
-                    all_entities.extend(entities)
-                    all_relationships.extend(relationships)
-
-            except Exception as e:
-                logger.warning(f"Failed to process {file_path}: {e}")
-                continue
-
-        logger.info(f"Analysis complete: {len(all_entities)} entities, {len(all_relationships)} relationships")
+        loop = asyncio.get_running_loop()
+        max_in_flight = (os.cpu_count() or 1) * 2
+
+        # Pre-build the parser backends and publish this server as the
+        # worker instance before the pool starts: with a fork context the
+        # children inherit both copy-on-write instead of each rebuilding
+        # them on first task. Where fork is unavailable the workers keep
+        # the lazy per-process init in _extract_buffer_worker.
+        global _worker_server
+        for language in languages:
+            self._get_ts_backend(language)
+        _worker_server = self
+        try:
+            mp_context = multiprocessing.get_context("fork")
+        except ValueError:
+            mp_context = None
+
+        # Prefetch file bytes through a small thread pool so the next
+        # file is already in memory when a parser worker frees up; the
+        # bounded queue caps how many file contents are held at once
+        prefetch: asyncio.Queue = asyncio.Queue(maxsize=max_in_flight)
+
+        async def _prefetch_files(io_pool):
+            for file_path in self._find_files_recursively(root_path, include_patterns, exclude_patterns):
+                try:
+                    language = await self._detect_file_language(file_path)
+                except Exception as e:
+                    logger.warning(f"Failed to process {file_path}: {e}")
+                    continue
+                if language not in languages:
+                    continue
+                read = loop.run_in_executor(io_pool, _read_file_bytes, str(file_path))
+                await prefetch.put((str(file_path), language, read))
+            await prefetch.put(None)
+
+        # Fan out CPU-bound parsing across a process pool to escape the GIL;
+        # language detection stays on the main process since it only reads a
+        # 1 KiB sample per file
+        with ThreadPoolExecutor(max_workers=4, thread_name_prefix="io-prefetch") as io_pool, \
+                ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context) as pool:
+            producer = asyncio.create_task(_prefetch_files(io_pool))
+            in_flight: Dict[asyncio.Future, str] = {}
+
+            while True:
+                item = await prefetch.get()
+                if item is None:
+                    break
+                file_path_str, language, read = item
+                try:
+                    data = await read
+                except OSError as e:
+                    logger.warning(f"Failed to read {file_path_str}: {e}")
+                    continue
+
+                # A NUL in the first 64 bytes means an accidentally-named
+                # binary; parsing one wastes far more time than this peek
+                if b'\x00' in data[:64]:
+                    logger.debug(f"Skipping binary file {file_path_str}")
+                    continue
+
+                future = asyncio.ensure_future(
+                    loop.run_in_executor(pool, _extract_buffer_worker, file_path_str, data, language))
+                in_flight[future] = file_path_str
+
+                if len(in_flight) >= max_in_flight:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    for finished in done:
+                        batch = self._drain_batch(finished, in_flight.pop(finished))
+                        if batch is not None:
+                            yield batch
+
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    batch = self._drain_batch(finished, in_flight.pop(finished))
+                    if batch is not None:
+                        yield batch
+
+            await producer
+
+    def _drain_batch(self, future: asyncio.Future, file_path: str) -> Optional[Dict[str, Any]]:
+        """Turn a completed worker future into a per-file result batch."""
+        try:
+            entities, relationships = future.result()
+        except Exception as e:
+            logger.warning(f"Worker failed to extract entities from {file_path}: {e}")
+            return None
 
         return {
-            "success": True,
-            "entities": all_entities,
-            "relationships": all_relationships,
-            "summary": {
-                "total_files_processed": len(all_entities),  # Approximation
-                "total_entities": len(all_entities),
-                "total_relationships": len(all_relationships)
-            }
+            "file": file_path,
+            "entities": entities,
+            "relationships": relationships
         }
 
     async def extract_file_entities(self, args: Dict[str, Any]) -> Dict[str, Any]:
@@ -141,7 +684,7 @@ class CodeAnalysisServer:
 
         return {
             "success": True,
-            "entities": entities,
+            "entities": entities.to_rows(),
             "relationships": relationships,
             "language": language,
             "file_path": file_path
@@ -177,37 +720,54 @@ class CodeAnalysisServer:
             "file_path": file_path
         }
 
+    def _get_matcher(self, patterns: List[str]) -> GlobSetMatcher:
+        """Get a compiled matcher for a pattern set, compiling on first use."""
+        key = tuple(patterns)
+        matcher = self._matcher_cache.get(key)
+        if matcher is None:
+            matcher = GlobSetMatcher(patterns)
+            self._matcher_cache[key] = matcher
+        return matcher
+
     def _find_files_recursively(self, root_path: Path, include_patterns: List[str],
-                               exclude_patterns: List[str]) -> List[Path]:
+                               exclude_patterns: List[str]) -> Iterator[Path]:
         """
         Recursively find files matching include patterns while excluding certain directories.
 
-        Note: This is a basic implementation. A full solution would use fnmatch or similar.
+        Iterative ``os.scandir`` walk that prunes excluded directories before
+        descending into them, so trees like ``.git/`` and ``node_modules/``
+        are never entered. Matching uses the cheap ``entry.name``/``entry.path``
+        strings; a ``Path`` is only constructed for yielded files.
         """
-        matching_files = []
-
-        def should_exclude(path: Path) -> bool:
-            path_str = str(path)
-            for exclude_pattern in exclude_patterns:
-                if exclude_pattern in path_str:
-                    return True
-            return False
-
-        def matches_include_pattern(filename: str) -> bool:
-            for pattern in include_patterns:
-                # Simple glob matching (basic implementation)
-                if pattern.startswith("*."):
-                    extension = pattern[1:]  # Remove *
-                    if filename.endswith(extension):
-                        return True
-            return False
-
-        for file_path in root_path.rglob("*"):
-            if file_path.is_file() and not should_exclude(file_path):
-                if matches_include_pattern(file_path.name):
-                    matching_files.append(file_path)
-
-        return matching_files
+        include_matcher = self._get_matcher(include_patterns)
+        exclude_matcher = self._get_matcher(exclude_patterns)
+
+        stack = [str(root_path)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                # The trailing slash lets "*/build/*"-style
+                                # patterns match the directory itself
+                                if not exclude_matcher.matches(entry.path + '/'):
+                                    stack.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                if include_matcher.matches(entry.name):
+                                    # entry.stat() reuses the cached result
+                                    # from is_file(), so the size gate is a
+                                    # free guard against minified bundles
+                                    # and other oversize junk
+                                    if entry.stat(follow_symlinks=False).st_size > MAX_FILE_BYTES:
+                                        logger.debug(f"Skipping oversize file {entry.path}")
+                                        continue
+                                    yield Path(entry.path)
+                        except OSError:
+                            continue
+            except OSError as e:
+                logger.warning(f"Cannot scan directory {current}: {e}")
 
     async def _detect_file_language(self, file_path: Path) -> str:
         """
@@ -215,16 +775,14 @@ class CodeAnalysisServer:
 
         Note: Basic implementation. Production would use more sophisticated detection.
         """
-        extension_map = {
-            ".cpp": "cpp", ".hpp": "cpp", ".cc": "cpp", ".cxx": "cpp",
-            ".py": "python",
-            ".js": "javascript", ".ts": "javascript", ".jsx": "javascript",
-            ".mq5": "mql5"
-        }
-
-        extension = file_path.suffix.lower()
-        if extension in extension_map:
-            return extension_map[extension]
+        # Slice the extension off the name directly rather than going through
+        # PurePath.suffix, which allocates intermediate objects per call
+        name = file_path.name
+        dot = name.rfind('.')
+        extension = name[dot:].lower() if dot >= 0 else ''
+        language = _EXT_MAP.get(extension)
+        if language is not None:
+            return language
 
         # Fallback to content-based detection
         content_sample = self._read_file_sample(file_path)
@@ -232,328 +790,480 @@ class CodeAnalysisServer:
         return language
 
     def _read_file_sample(self, file_path: Path, max_bytes: int = 1024) -> str:
-        """Read first N bytes from file for language detection."""
+        """
+        Read first N bytes from file for language detection.
+
+        Uses a raw os.open/os.read pair: one syscall and one small bytes
+        allocation per file, with none of the BufferedReader/TextIOWrapper
+        machinery a text-mode open would build just to read 1 KiB.
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read(max_bytes)
-        except Exception:
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+            try:
+                buf = os.read(fd, max_bytes)
+            finally:
+                os.close(fd)
+            return buf.decode('utf-8', errors='ignore')
+        except OSError:
             return ""
 
     async def _detect_language_from_content(self, content: str) -> tuple[str, float, List[str]]:
         """
         Detect programming language from content sample.
 
-        Note: Very basic implementation. Production would use ML-based detection.
+        One automaton pass over the sample instead of per-language substring
+        scans; see LanguageDetector.
         """
-        patterns = []
-
-        # C/C++ patterns
-        if any(pattern in content for pattern in ["#include", "std::", "namespace", "class ", "public:", "private:"]):
-            patterns.extend(["#include", "std::", "class "])
-            cpp_score = len(patterns) / 3.0
-            if cpp_score > 0.6:
-                return "cpp", min(cpp_score, 1.0), patterns
-
-        # Python patterns
-        if any(pattern in content for pattern in ["def ", "import ", "from ", "class ", "self.", "print(", "__init__"]):
-            patterns.extend(["def ", "import ", "class "])
-            py_score = len(patterns) / 3.0
-            if py_score > 0.5:
-                return "python", min(py_score, 1.0), patterns
-
-        # JavaScript patterns
-        if any(pattern in content for pattern in ["function ", "const ", "let ", "var ", "console.log", "=> {", "export ", "import "]):
-            patterns.extend(["function ", "const ", "=> {"])
-            js_score = len(patterns) / 3.0
-            if js_score > 0.5:
-                return "javascript", min(js_score, 1.0), patterns
-
-        # MQL5 patterns
-        if any(pattern in content for pattern in ["int OnInit", "void OnTick", "double ", "#property", "MQL5"]):
-            patterns.extend(["int OnInit", "void OnTick", "#property"])
-            mql5_score = len(patterns) / 3.0
-            if mql5_score > 0.6:
-                return "mql5", min(mql5_score, 1.0), patterns
-
-        return "unknown", 0.0, patterns
-
-    async def _extract_entities_from_file(self, file_path: Path, language: str) -> tuple[List[Dict], List[Dict]]:
+        return self._lang_detector.detect(content)
+
+    async def _extract_entities_from_file(self, file_path: Path, language: str) -> tuple[EntityTable, List[Dict]]:
         """
         Extract entities and relationships from a file.
 
         Note: This is a basic implementation. Production would use actual parsers.
         """
-        entities = []
+        return self._extract_entities_sync(file_path, language)
+
+    def _extract_entities_sync(self, file_path: Path, language: str) -> tuple[EntityTable, List[Dict]]:
+        """Synchronous extraction core, also run inside process-pool workers."""
+        try:
+            with open(file_path, 'rb') as f:
+                try:
+                    # Map the file so hashing and parsing read kernel pages
+                    # directly with no full decode; empty files cannot be
+                    # mapped and are read as plain bytes instead
+                    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    return self._extract_from_buffer(f.read(), file_path, language)
+
+                with buf:
+                    return self._extract_from_buffer(buf, file_path, language)
+        except OSError as e:
+            logger.warning(f"Failed to read {file_path}: {e}")
+            return EntityTable(), []
+
+    def _extract_from_buffer(self, content_bytes, file_path: Path,
+                             language: str) -> tuple[EntityTable, List[Dict]]:
+        """Extract from an in-memory buffer (bytes or mmap), via the cache."""
+        entities = EntityTable()
         relationships = []
 
+        # Serve unchanged files straight from the persistent cache
+        sha = hashlib.sha256(content_bytes).digest()
+        cached = self._ast_cache.get(str(file_path), sha)
+        if cached is not None:
+            return cached
+
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+            backend = self._get_ts_backend(language)
+            if backend is not None:
+                entities, relationships = self._extract_entities_ts(
+                    content_bytes, str(file_path), language)
+                self._ast_cache.put(str(file_path), sha, entities, relationships)
+                return entities, relationships
 
             if language == "cpp":
-                entities, relationships = self._extract_cpp_entities(content, str(file_path))
+                entities, relationships = self._extract_cpp_entities(content_bytes, str(file_path))
             elif language == "python":
-                entities, relationships = self._extract_python_entities(content, str(file_path))
+                entities, relationships = self._extract_python_entities(content_bytes, str(file_path))
             elif language == "javascript":
-                entities, relationships = self._extract_javascript_entities(content, str(file_path))
+                entities, relationships = self._extract_javascript_entities(content_bytes, str(file_path))
             elif language == "mql5":
-                entities, relationships = self._extract_mql5_entities(content, str(file_path))
+                entities, relationships = self._extract_mql5_entities(content_bytes, str(file_path))
 
         except Exception as e:
             logger.warning(f"Failed to extract entities from {file_path}: {e}")
+            return entities, relationships
 
+        self._ast_cache.put(str(file_path), sha, entities, relationships)
         return entities, relationships
 
-    def _extract_cpp_entities(self, content: str, file_path: str) -> tuple[List[Dict], List[Dict]]:
-        """Extract C/C++ entities (basic implementation)"""
-        entities = []
-        relationships = []
+    def _get_ts_backend(self, language: str) -> Optional[tuple]:
+        """Get (parser, query) for a language, building it on first use."""
+        if not TREE_SITTER_AVAILABLE or language not in TS_ENTITY_QUERIES:
+            return None
 
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # Class extraction
-            if line.startswith("class "):
-                parts = line.split()
-                if len(parts) > 1:
-                    class_name = parts[1].split('{')[0].split(':')[0].strip()
-                    entities.append({
-                        "id": f"class_{class_name}",
-                        "name": class_name,
-                        "type": "class",
-                        "language": "cpp",
-                        "file": file_path,
-                        "line": line_num,
-                        "scope": "global"
-                    })
-
-            # Function extraction
-            elif " " in line and "(" in line and ")" in line and not line.startswith("//"):
-                # Very basic function detection
-                if "::" in line or " " in line:
-                    entities.append({
-                        "id": f"function_line_{line_num}",
-                        "name": f"function_at_line_{line_num}",
-                        "type": "function",
-                        "language": "cpp",
-                        "file": file_path,
-                        "line": line_num,
-                        "scope": "global"
-                    })
+        backend = self._ts_backends.get(language)
+        if backend is None:
+            try:
+                parser = get_parser(language)
+                query = parser.language.query(TS_ENTITY_QUERIES[language])
+                backend = (parser, query)
+                self._ts_backends[language] = backend
+            except Exception as e:
+                logger.warning(f"Failed to build tree-sitter backend for {language}: {e}")
+                self._ts_backends[language] = None
+                return None
 
-        return entities, relationships
+        return backend
 
-    def _extract_python_entities(self, content: str, file_path: str) -> tuple[List[Dict], List[Dict]]:
-        """Extract Python entities (basic implementation)"""
-        entities = []
+    def _extract_entities_ts(self, content: bytes, file_path: str,
+                             language: str) -> tuple[EntityTable, List[Dict]]:
+        """Extract entities via tree-sitter AST traversal (all languages)."""
+        entities = EntityTable()
         relationships = []
+        fid = entities.file_id(file_path)
+
+        parser, query = self._ts_backends[language]
+        tree = parser.parse(content)
 
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # Class extraction
-            if line.startswith("class "):
-                parts = line.split()
-                if len(parts) > 1:
-                    class_name = parts[1].split('(')[0].split(':')[0].strip()
-                    entities.append({
-                        "id": f"class_{class_name}",
-                        "name": class_name,
-                        "type": "class",
-                        "language": "python",
-                        "file": file_path,
-                        "line": line_num,
-                        "scope": "global"
-                    })
-
-            # Function extraction
-            elif line.startswith("def "):
-                func_part = line[4:].split('(')[0].strip()
-                entities.append({
-                    "id": f"function_{func_part}",
-                    "name": func_part,
-                    "type": "function",
-                    "language": "python",
-                    "file": file_path,
-                    "line": line_num,
-                    "scope": "global"
-                })
+        for node, capture_name in query.captures(tree.root_node):
+            entity_type = _T_CLASS if capture_name == "class.name" else _T_FUNCTION
+            name = node.text.decode('utf-8', errors='ignore')
+            entities.append(f"{entity_type}_{name}", name, entity_type,
+                            sys.intern(language), fid, node.start_point[0] + 1)
 
         return entities, relationships
 
-    def _extract_javascript_entities(self, content: str, file_path: str) -> tuple[List[Dict], List[Dict]]:
-        """Extract JavaScript entities (basic implementation)"""
-        entities = []
+    def _extract_named_entities(self, pattern: "re.Pattern[bytes]", content: bytes,
+                                file_path: str, language: str) -> EntityTable:
+        """Run a class/function alternation over the buffer in one pass."""
+        entities = EntityTable()
+        fid = entities.file_id(file_path)
+        newlines = _newline_index(content)
+        for m in pattern.finditer(content):
+            class_name, function_name = m.group(1), m.group(2)
+            if class_name is not None:
+                entity_type = _T_CLASS
+                name = class_name.decode('utf-8', errors='ignore')
+            else:
+                entity_type = _T_FUNCTION
+                name = function_name.decode('utf-8', errors='ignore')
+            entities.append(f"{entity_type}_{name}", name, entity_type,
+                            sys.intern(language), fid, bisect_right(newlines, m.start()) + 1)
+        return entities
+
+    def _extract_cpp_entities(self, content: bytes, file_path: str) -> tuple[EntityTable, List[Dict]]:
+        """Extract C/C++ entities (regex fallback)"""
+        entities = EntityTable()
         relationships = []
+        fid = entities.file_id(file_path)
+        newlines = _newline_index(content)
+
+        for m in self._CPP_CLASS_RE.finditer(content):
+            class_name = m.group(1).decode('utf-8', errors='ignore')
+            entities.append(f"class_{class_name}", class_name, _T_CLASS, _L_CPP,
+                            fid, bisect_right(newlines, m.start()) + 1)
 
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # Class extraction
-            if line.startswith("class "):
-                parts = line.split()
-                if len(parts) > 1:
-                    class_name = parts[1].split('{')[0].strip()
-                    entities.append({
-                        "id": f"class_{class_name}",
-                        "name": class_name,
-                        "type": "class",
-                        "language": "javascript",
-                        "file": file_path,
-                        "line": line_num,
-                        "scope": "global"
-                    })
-
-            # Function extraction
-            elif line.startswith("function "):
-                func_part = line[9:].split('(')[0].strip()
-                entities.append({
-                    "id": f"function_{func_part}",
-                    "name": func_part,
-                    "type": "function",
-                    "language": "javascript",
-                    "file": file_path,
-                    "line": line_num,
-                    "scope": "global"
-                })
+        for m in self._CPP_FUNCTION_RE.finditer(content):
+            line_num = bisect_right(newlines, m.start()) + 1
+            line_str = str(line_num)
+            entities.append(_FN_LINE_PREFIX + line_str, _FN_AT_LINE_PREFIX + line_str,
+                            _T_FUNCTION, _L_CPP, fid, line_num)
 
         return entities, relationships
 
-    def _extract_mql5_entities(self, content: str, file_path: str) -> tuple[List[Dict], List[Dict]]:
-        """Extract MQL5 entities (basic implementation)"""
-        entities = []
+    def _extract_python_entities(self, content: bytes, file_path: str) -> tuple[EntityTable, List[Dict]]:
+        """Extract Python entities (regex fallback)"""
+        return self._extract_named_entities(self._PY_ENTITY_RE, content, file_path, _L_PYTHON), []
+
+    def _extract_javascript_entities(self, content: bytes, file_path: str) -> tuple[EntityTable, List[Dict]]:
+        """Extract JavaScript entities (regex fallback)"""
+        return self._extract_named_entities(self._JS_ENTITY_RE, content, file_path, _L_JAVASCRIPT), []
+
+    def _extract_mql5_entities(self, content: bytes, file_path: str) -> tuple[EntityTable, List[Dict]]:
+        """Extract MQL5 entities (regex fallback)"""
+        entities = EntityTable()
         relationships = []
+        fid = entities.file_id(file_path)
+        newlines = _newline_index(content)
 
-        lines = content.split('\n')
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # Function extraction (MQL5 specific)
-            if ("int " in line or "void " in line or "double " in line) and "(" in line:
-                if "OnInit" in line or "OnTick" in line or "OnDeinit" in line:
-                    func_name = line.split('(')[0].split()[-1]
-                    entities.append({
-                        "id": f"function_{func_name}",
-                        "name": func_name,
-                        "type": "event_handler",
-                        "language": "mql5",
-                        "file": file_path,
-                        "line": line_num,
-                        "scope": "global"
-                    })
+        for m in self._MQL5_HANDLER_RE.finditer(content):
+            func_name = m.group(1).decode('utf-8', errors='ignore')
+            entities.append(f"function_{func_name}", func_name, _T_EVENT_HANDLER,
+                            _L_MQL5, fid, bisect_right(newlines, m.start()) + 1)
 
         return entities, relationships
 
 
+class MessageWriter:
+    """
+    Coalesces outgoing JSON-RPC frames into batched stdout writes.
+
+    Frames queue in a deque and are flushed as one os.writev call (or one
+    joined buffered write where writev is unavailable) after a short delay
+    or once the queue passes the byte threshold. Bursts of streaming
+    progress notifications then cost one syscall per batch instead of one
+    per message.
+    """
+
+    FLUSH_DELAY = 0.002
+    FLUSH_BYTES = 64 * 1024
+
+    def __init__(self):
+        self._frames: deque = deque()
+        self._pending_bytes = 0
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def write(self, message: Dict[str, Any]):
+        """Queue one message; flushes immediately past the byte threshold."""
+        self.write_raw(orjson.dumps(message) + b"\n")
+
+    def write_raw(self, frame: bytes):
+        """Queue one pre-serialized newline-terminated frame."""
+        self._frames.append(frame)
+        self._pending_bytes += len(frame)
+
+        if self._pending_bytes >= self.FLUSH_BYTES:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop (e.g. called from sync context): flush inline
+            self.flush()
+            return
+        self._flush_task = loop.create_task(self._delayed_flush())
+
+    async def _delayed_flush(self):
+        await asyncio.sleep(self.FLUSH_DELAY)
+        self.flush()
+
+    def flush(self):
+        """Write all queued frames with a single syscall."""
+        if not self._frames:
+            return
+        frames = list(self._frames)
+        self._frames.clear()
+        self._pending_bytes = 0
+
+        if hasattr(os, 'writev'):
+            fd = sys.stdout.fileno()
+            total = sum(len(f) for f in frames)
+            written = os.writev(fd, frames)
+            if written < total:
+                remaining = b"".join(frames)[written:]
+                while remaining:
+                    remaining = remaining[os.write(fd, remaining):]
+        else:
+            buf = sys.stdout.buffer
+            buf.write(b"".join(frames))
+            buf.flush()
+
+
+_writer = MessageWriter()
+
+
+def _write_message(message: Dict[str, Any]):
+    """Queue one JSON-RPC message on the batched writer."""
+    _writer.write(message)
+
+
+# Per-process server instance for pool workers; parsers are built lazily on
+# first use and then reused for every task the worker receives
+_worker_server: Optional[CodeAnalysisServer] = None
+
+
+def _read_file_bytes(path: str) -> bytes:
+    """Blocking whole-file read, run on the prefetch thread pool."""
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def _extract_buffer_worker(path: str, data: bytes,
+                           language: str) -> tuple[List[Dict], List[Dict]]:
+    """Process-pool entry point for extraction from prefetched bytes."""
+    global _worker_server
+    if _worker_server is None:
+        _worker_server = CodeAnalysisServer()
+    return _worker_server._extract_from_buffer(data, Path(path), language)
+
+
+async def stream_analyze_codebase(server: CodeAnalysisServer, request_id: Any,
+                                  tool_args: Dict[str, Any]) -> Dict[str, Any]:
+    """Run analyze_codebase as a stream, emitting a progress notification per file."""
+    files_processed = 0
+    total_entities = 0
+    total_relationships = 0
+
+    try:
+        async for batch in server.analyze_codebase_stream(tool_args):
+            files_processed += 1
+            total_entities += len(batch["entities"])
+            total_relationships += len(batch["relationships"])
+
+            notification = {
+                "jsonrpc": "2.0",
+                "method": "notifications/progress",
+                "params": {
+                    "progressToken": request_id,
+                    "file": batch["file"],
+                    "entities": batch["entities"].to_rows(),
+                    "relationships": batch["relationships"]
+                }
+            }
+            _write_message(notification)
+
+    except Exception as e:
+        logger.error(f"Error streaming analyze_codebase: {e}")
+        return {"success": False, "error": str(e)}
+
+    return {
+        "success": True,
+        "summary": {
+            "total_files_processed": files_processed,
+            "total_entities": total_entities,
+            "total_relationships": total_relationships
+        }
+    }
+
+
+# The initialize and tools/list results are static aside from the JSON-RPC
+# id, so their serialized form is computed once at import and spliced with
+# the id per request instead of rebuilding and re-encoding the dicts
+_RESPONSE_HEAD = b'{"jsonrpc":"2.0","id":'
+
+_INITIALIZE_TAIL = b',"result":' + orjson.dumps({
+    "protocolVersion": "0.1.0",
+    "capabilities": {
+        "tools": {
+            "listChanged": False
+        }
+    },
+    "serverInfo": {
+        "name": "code-analysis-server",
+        "version": "0.1.0"
+    }
+}) + b'}\n'
+
+_TOOLS_LIST_TAIL = b',"result":' + orjson.dumps({
+    "tools": [
+        {
+            "name": "analyze_codebase",
+            "description": "Analyze entire codebase for entity extraction",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "path": {"type": "string"},
+                    "languages": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["path", "languages"]
+            }
+        },
+        {
+            "name": "extract_file_entities",
+            "description": "Extract entities from single file",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "file_path": {"type": "string"},
+                    "language": {"type": "string"}
+                },
+                "required": ["file_path", "language"]
+            }
+        },
+        {
+            "name": "detect_language",
+            "description": "Detect programming language from file content",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "file_path": {"type": "string"},
+                    "content_sample": {"type": "string"}
+                },
+                "required": ["file_path"]
+            }
+        }
+    ]
+}) + b'}\n'
+
+
+async def _handle_initialize(server: CodeAnalysisServer, message_data: Dict[str, Any]):
+    """Respond to initialization with the precomputed result bytes."""
+    _writer.write_raw(
+        _RESPONSE_HEAD + orjson.dumps(message_data["id"]) + _INITIALIZE_TAIL)
+
+
+async def _handle_tools_list(server: CodeAnalysisServer, message_data: Dict[str, Any]):
+    """List available tools from the precomputed result bytes."""
+    _writer.write_raw(
+        _RESPONSE_HEAD + orjson.dumps(message_data["id"]) + _TOOLS_LIST_TAIL)
+
+
+async def _handle_tools_call(server: CodeAnalysisServer, message_data: Dict[str, Any]):
+    """Handle tool calls."""
+    params = message_data["params"]
+    tool_name = params["name"]
+    tool_args = params["arguments"]
+
+    if tool_name == "analyze_codebase":
+        # Stream per-file batches as progress notifications so the
+        # client can drain results incrementally
+        result = await stream_analyze_codebase(server, message_data["id"], tool_args)
+    else:
+        result = await server.handle_call_tool(tool_name, tool_args)
+
+    response = {
+        "jsonrpc": "2.0",
+        "id": message_data["id"],
+        "result": result
+    }
+    _write_message(response)
+
+
+# JSON-RPC method dispatch: one dict lookup per message instead of
+# chained string comparisons
+_METHOD_HANDLERS = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+}
+
+
+async def handle_message(server: CodeAnalysisServer, message: str):
+    """Parse and dispatch one JSON-RPC message."""
+    try:
+        message_data = orjson.loads(message)
+
+        handler = _METHOD_HANDLERS.get(message_data.get("method"))
+        if handler is not None:
+            await handler(server, message_data)
+
+    except orjson.JSONDecodeError:
+        logger.error("Invalid JSON received")
+    except Exception as e:
+        logger.error(f"Error processing message: {e}")
+
+
 async def run_stdio_async():
     """Run the MCP server using stdio protocol."""
     server = CodeAnalysisServer()
 
     logger.info("CodeAnalysisServer MCP starting with stdio protocol...")
 
-    # Basic MCP handshake and message loop
-    # In production, this would use the official MCP library
-    while True:
-        try:
-            # Read messages from stdin (JSON-RPC format)
-            message = await asyncio.get_event_loop().run_in_executor(None, sys.stdin.readline)
-            if not message:
-                break
-
-            # Parse and handle the message
-            message_data = json.loads(message.strip())
-
-            if "method" in message_data and message_data["method"] == "initialize":
-                # Respond to initialization
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": message_data["id"],
-                    "result": {
-                        "protocolVersion": "0.1.0",
-                        "capabilities": {
-                            "tools": {
-                                "listChanged": False
-                            }
-                        },
-                        "serverInfo": {
-                            "name": "code-analysis-server",
-                            "version": "0.1.0"
-                        }
-                    }
-                }
-                print(json.dumps(response), flush=True)
-
-            elif "method" in message_data and message_data["method"] == "tools/list":
-                # List available tools
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": message_data["id"],
-                    "result": {
-                        "tools": [
-                            {
-                                "name": "analyze_codebase",
-                                "description": "Analyze entire codebase for entity extraction",
-                                "inputSchema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "path": {"type": "string"},
-                                        "languages": {"type": "array", "items": {"type": "string"}}
-                                    },
-                                    "required": ["path", "languages"]
-                                }
-                            },
-                            {
-                                "name": "extract_file_entities",
-                                "description": "Extract entities from single file",
-                                "inputSchema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "file_path": {"type": "string"},
-                                        "language": {"type": "string"}
-                                    },
-                                    "required": ["file_path", "language"]
-                                }
-                            },
-                            {
-                                "name": "detect_language",
-                                "description": "Detect programming language from file content",
-                                "inputSchema": {
-                                    "type": "object",
-                                    "properties": {
-                                        "file_path": {"type": "string"},
-                                        "content_sample": {"type": "string"}
-                                    },
-                                    "required": ["file_path"]
-                                }
-                            }
-                        ]
-                    }
-                }
-                print(json.dumps(response), flush=True)
+    # A dedicated reader thread feeds framed messages into the queue so the
+    # event loop never blocks on stdin and pays no per-line executor dispatch
+    queue: asyncio.Queue = asyncio.Queue()
+    loop = asyncio.get_running_loop()
 
-            elif "method" in message_data and message_data["method"] == "tools/call":
-                # Handle tool calls
-                params = message_data["params"]
-                tool_name = params["name"]
-                tool_args = params["arguments"]
+    def reader():
+        for line in sys.stdin:
+            loop.call_soon_threadsafe(queue.put_nowait, line)
+        loop.call_soon_threadsafe(queue.put_nowait, None)  # EOF sentinel
 
-                result = await server.handle_call_tool(tool_name, tool_args)
+    threading.Thread(target=reader, daemon=True, name="stdin-reader").start()
 
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": message_data["id"],
-                    "result": result
-                }
-                print(json.dumps(response), flush=True)
-
-        except json.JSONDecodeError:
-            logger.error("Invalid JSON received")
-            continue
-        except Exception as e:
-            logger.error(f"Error processing message: {e}")
-            continue
+    # Each message is handled in its own task so tool calls can overlap
+    # while the next request is already queued
+    pending: set = set()
+    while True:
+        message = await queue.get()
+        if message is None:
+            break
+        task = asyncio.create_task(handle_message(server, message))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+
+    # Let in-flight handlers finish, then drain frames still queued on the
+    # batched writer before exit
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+    _writer.flush()
 
 
 if __name__ == "__main__":
@@ -9,15 +9,20 @@ This server transforms ROMILLM documentation into a living, breathing intelligen
 """
 
 import asyncio
-import json
+import mmap
+import multiprocessing
 import os
 import re
+import sqlite3
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 import time
 import hashlib
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -28,6 +33,208 @@ logging.basicConfig(
 )
 logger = logging.getLogger("documentation-mcp-server")
 
+# Optional accelerator: a true DFA for multi-word matching (pip install
+# pyahocorasick); the server falls back to a compiled regex alternation
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional accelerator: SIMD-accelerated hashing for change detection (pip
+# install blake3); stdlib blake2b is the fallback and still beats md5
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Optional accelerator: vectorized newline indexing on large documents
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional: filesystem-event wake (pip install watchdog); the server falls
+# back to interval polling without it
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    WATCHDOG_AVAILABLE = False
+
+
+def _newline_index(content: str) -> List[int]:
+    """Offsets of every newline in content, for bisect line lookups.
+
+    One vectorized scan with numpy when available; otherwise a loop over
+    str.find, which still runs at C speed per hop instead of splitting the
+    document into a second full copy.
+    """
+    if NUMPY_AVAILABLE:
+        raw = np.frombuffer(content.encode('utf-8', 'surrogatepass'), dtype=np.uint8)
+        if len(raw) == len(content):  # pure-ASCII: byte offsets == char offsets
+            return np.flatnonzero(raw == 0x0A).tolist()
+
+    offsets = []
+    pos = content.find('\n')
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find('\n', pos + 1)
+    return offsets
+
+
+def _hash_digest(data: bytes) -> bytes:
+    """Raw content digest (not security-sensitive)."""
+    if BLAKE3_AVAILABLE:
+        return blake3.blake3(data).digest()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _hash_content(data: bytes) -> str:
+    """Content digest for change detection (not security-sensitive)."""
+    return _hash_digest(data).hex()
+
+
+def _hash_file(path: Path) -> str:
+    """File digest with constant Python-level memory regardless of size.
+
+    The file is mapped and the hash reads kernel pages directly, so no
+    bytes object the size of the document is ever allocated; empty files
+    cannot be mapped and fall back to chunked reads.
+    """
+    h = blake3.blake3() if BLAKE3_AVAILABLE else hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+                return h.hexdigest()
+        except (ValueError, OSError):
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+class HyperlinkCache:
+    """
+    Persistent cache of hyperlinked output keyed by content and vocabulary.
+
+    A document whose bytes and entity vocabulary both match a previous run
+    gets its already-produced output back without any extraction work, so
+    touched-but-unchanged files cost one hash plus one SQLite lookup. The
+    connection opens lazily; a vocabulary edit changes every key and
+    thereby invalidates the whole cache.
+    """
+
+    def __init__(self, db_path: Path):
+        self._db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            # The writer stage runs saves on worker threads, so the single
+            # connection is shared and guarded by the lock instead
+            self._conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS hyperlinked("
+                "key BLOB PRIMARY KEY, output BLOB)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS state("
+                "path TEXT PRIMARY KEY, hash TEXT, mtime_ns INTEGER, "
+                "size INTEGER, output_path TEXT)")
+        return self._conn
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Return cached hyperlinked bytes or None on miss."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT output FROM hyperlinked WHERE key=?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Hyperlink cache read failed: {e}")
+            return None
+        return row[0] if row is not None else None
+
+    def put(self, key: bytes, output: bytes):
+        """Store hyperlinked bytes for a (content, vocabulary) key."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO hyperlinked(key, output) VALUES(?, ?)",
+                    (key, output))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"Hyperlink cache write failed: {e}")
+
+    def iter_state(self):
+        """Yield (path, hash, mtime_ns, size, output_path) rows."""
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    "SELECT path, hash, mtime_ns, size, output_path "
+                    "FROM state").fetchall()
+        except sqlite3.Error as e:
+            logger.debug(f"State read failed: {e}")
+            return
+        yield from rows
+
+    def put_state(self, path: str, digest: str, mtime_ns: int, size: int,
+                  output_path: Optional[str]):
+        """Record a document's change-detection state."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO state(path, hash, mtime_ns, size, "
+                    "output_path) VALUES(?, ?, ?, ?, ?)",
+                    (path, digest, mtime_ns, size, output_path))
+                conn.commit()
+        except sqlite3.Error as e:
+            logger.debug(f"State write failed: {e}")
+
+# Known entity names (expand as needed). This is the fixed vocabulary the
+# scanner matches against, alongside the keys of entity_classifications
+ENTITY_VOCABULARY = [
+    'Injection_Pipeline', 'Knowledge_Graph_Processing',
+    'Deterministic_Routing_Engine', 'Template_Generation_System',
+    'Hybrid_Search_Fusion_Engine', 'Core_Orchestration_Framework',
+    'DocParser', 'Document_Parser', 'Entity_Extractor', 'Content_Chunker',
+    'Graph_Constructor', 'Graph_Algorithms', 'Relationship_Fusion',
+    'Intent_Classifier', 'Processing_Router', 'Content_Filter',
+    'Template_Generator', 'Response_Builder', 'Format_Optimizer',
+    'Vector_Retriever', 'Graph_Traverser', 'Result_Fusion',
+    'Pipeline_Manager', 'Memory_Manager',
+    'ROMILLM_Architecture', 'ROMILLM',
+]
+
+@dataclass(slots=True, frozen=True)
+class EntityClassification:
+    """One entity's classification, quantized from the declarative table.
+
+    Slots instead of a per-entity dict keeps the hot match loop's lookups
+    on fixed attribute offsets and shrinks the table's memory footprint.
+    """
+    type: str = "unknown"
+    classification: str = "Unclassified"
+    project_structure: bool = False
+    ascii_tree: bool = False
+    hyperlink: bool = False
+    domain_number: str = "N/A"
+    description: str = "Entity description"
+    reason: str = ""
+    layers: tuple = ()
+
+
+_UNCLASSIFIED = EntityClassification(
+    reason="Entity not found in classification system")
+
+
 # MCP Protocol Implementation (Simplified)
 class MCPClient:
     """Simplified MCP client for communicating with Knowledge Graph server."""
@@ -210,45 +417,70 @@ class MCPClient:
             }
         }
 
-    async def query_graph_node(self, entity_name: str) -> Optional[Dict]:
-        """Query Knowledge Graph for entity details with classification."""
-        # Return classification-based entity information
-        classification = self.entity_classifications.get(entity_name)
-        if classification:
-            return {
-                "name": entity_name,
-                "classification": classification.get("classification", "Unknown"),
-                "type": classification.get("type", "unknown"),
-                "description": classification.get("description", "Entity description"),
-                "project_structure_required": classification.get("project_structure", False),
-                "ascii_tree_included": classification.get("ascii_tree", False),
-                "domain_number": classification.get("domain_number", "N/A"),
-                "layers": classification.get("layers", []),
-                "reason": classification.get("reason", "")
+        # Interned keys make every per-mention lookup a pointer comparison
+        # on the fast path instead of a full string compare
+        self.entity_classifications = {
+            sys.intern(name): c for name, c in self.entity_classifications.items()
+        }
+
+        # Quantize the table into frozen slots instances held in one flat
+        # list with an integer index per name: attribute access on fixed
+        # offsets in the hot loop instead of dict probing per field
+        self._cls_idx: Dict[str, int] = {}
+        self._cls_list: List[EntityClassification] = []
+        for name, c in self.entity_classifications.items():
+            self._cls_idx[name] = len(self._cls_list)
+            self._cls_list.append(EntityClassification(
+                type=c.get("type", "unknown"),
+                classification=c.get("classification", "Unknown"),
+                project_structure=c.get("project_structure", False),
+                ascii_tree=c.get("ascii_tree", False),
+                hyperlink=c.get("hyperlink", False),
+                domain_number=str(c.get("domain_number", "N/A")),
+                description=c.get("description", "Entity description"),
+                reason=c.get("reason", ""),
+                layers=tuple(c.get("layers", ()))
+            ))
+
+        # Node-detail dicts are derived once from the classification table;
+        # per-mention queries then return the shared reference with a single
+        # hash lookup instead of rebuilding the dict through .get chains
+        self._node_details = {
+            name: {
+                "name": name,
+                "classification": cls.classification,
+                "type": cls.type,
+                "description": cls.description,
+                "project_structure_required": cls.project_structure,
+                "ascii_tree_included": cls.ascii_tree,
+                "domain_number": cls.domain_number,
+                "layers": list(cls.layers),
+                "reason": cls.reason
             }
+            for name, cls in ((n, self._cls_list[i])
+                              for n, i in self._cls_idx.items())
+        }
+
+    def query_graph_node(self, entity_name: str) -> Optional[Dict]:
+        """Query Knowledge Graph for entity details with classification.
 
-        return None
+        Synchronous: the lookup never awaits anything, and keeping it off
+        the async path avoids a coroutine frame per entity mention.
+        """
+        return self._node_details.get(entity_name)
 
-    def get_entity_classification(self, entity_name: str) -> Dict:
+    def get_entity_classification(self, entity_name: str) -> EntityClassification:
         """Get detailed classification information for an entity."""
-        return self.entity_classifications.get(entity_name, {
-            "type": "unknown",
-            "project_structure": False,
-            "ascii_tree": False,
-            "hyperlink": False,
-            "classification": "Unclassified",
-            "reason": "Entity not found in classification system"
-        })
+        idx = self._cls_idx.get(entity_name)
+        return self._cls_list[idx] if idx is not None else _UNCLASSIFIED
 
     def is_structural_entity(self, entity_name: str) -> bool:
         """Determine if entity requires project structure."""
-        classification = self.get_entity_classification(entity_name)
-        return classification.get("project_structure", False)
+        return self.get_entity_classification(entity_name).project_structure
 
     def is_hyperlinkable(self, entity_name: str) -> bool:
         """Determine if entity should be hyperlinked."""
-        classification = self.get_entity_classification(entity_name)
-        return classification.get("hyperlink", False)
+        return self.get_entity_classification(entity_name).hyperlink
 
 @dataclass
 class EntityMention:
@@ -259,6 +491,8 @@ class EntityMention:
     end_pos: int
     context: str
     surrounding_text: str
+    doc_start: int = -1  # offset into the full document content
+    doc_end: int = -1
 
 @dataclass
 class Hyperlink:
@@ -268,6 +502,8 @@ class Hyperlink:
     line: int
     context: str
     entity_details: Dict
+    doc_start: int = -1  # span in the full document, from the mention
+    doc_end: int = -1
 
 class DocumentationMCPServer:
     """
@@ -282,7 +518,56 @@ class DocumentationMCPServer:
         self.update_interval = update_interval
         self.kg_client = MCPClient(kg_server_uri)
         self.document_hashes = {}  # Track file changes
+        self.document_stats = {}  # (st_mtime_ns, st_size) per file for the cheap pre-check
         self.hyperlinked_docs = {}  # Store generated hyperlinked versions
+        self._dir_cache = {}  # dir path -> (mtime_ns, subdirs, md files)
+        self._made_dirs = set()  # output parents already created this run
+
+        # The entity vocabulary is finite, so matching can be a single
+        # linear-time Aho-Corasick pass independent of vocabulary size;
+        # without pyahocorasick, one compiled alternation scanned once over
+        # the whole document (longest names first so the full name wins)
+        vocabulary = {sys.intern(name) for name in ENTITY_VOCABULARY}
+        vocabulary.update(self.kg_client.entity_classifications)
+
+        # Matching is exact-case: the vocabulary is PascalCase/Snake_Case
+        # identifiers, so case folding only bought false positives and a
+        # slower engine path
+        if AHOCORASICK_AVAILABLE:
+            self._ac = ahocorasick.Automaton()
+            for name in vocabulary:
+                self._ac.add_word(name, name)
+            self._ac.make_automaton()
+            self._entity_re = None
+        else:
+            self._ac = None
+            ordered = sorted(vocabulary, key=len, reverse=True)
+            self._entity_re = re.compile(
+                r'\b(' + '|'.join(re.escape(name) for name in ordered) + r')\b')
+
+        # Persistent output cache: identical content under an identical
+        # vocabulary is served without re-running extraction
+        self._vocab_hash = _hash_digest('\n'.join(sorted(vocabulary)).encode())
+        self._hyperlink_cache = HyperlinkCache(Path("hyperlinked_docs/.cache.sqlite"))
+
+        # The scan/insert hot path is pure CPU under the GIL, so cache
+        # misses run on a process pool; workers build their own matcher
+        # lazily on first task and reuse it. Processes only spawn on first
+        # submit, so idle servers pay nothing for the pool
+        try:
+            mp_context = multiprocessing.get_context("fork")
+        except ValueError:
+            mp_context = None
+        self._pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=mp_context)
+
+        # Restore change-detection state from the previous run so a restart
+        # over an already-processed tree is stat checks, not reprocessing
+        for doc_path, digest, mtime_ns, size, output_path in self._hyperlink_cache.iter_state():
+            self.document_hashes[doc_path] = digest
+            self.document_stats[doc_path] = (mtime_ns, size)
+            if output_path:
+                self.hyperlinked_docs[doc_path] = output_path
 
         logger.info(f"Documentation MCP Server initialized with doc_root: {doc_root}")
 
@@ -290,6 +575,10 @@ class DocumentationMCPServer:
         """Main server loop - continuously monitors and updates documentation."""
         logger.info("Starting real-time documentation server...")
 
+        if WATCHDOG_AVAILABLE:
+            await self._run_event_driven()
+            return
+
         while True:
             try:
                 await self.update_documentation_cycle()
@@ -298,31 +587,196 @@ class DocumentationMCPServer:
                 logger.error(f"Error in documentation update cycle: {e}")
                 await asyncio.sleep(1)  # Brief pause before retry
 
+    async def _run_event_driven(self):
+        """Wake on filesystem events instead of polling every interval.
+
+        A watchdog observer pushes markdown-file events into an asyncio
+        queue; each burst of events is debounced for 200ms before one
+        update cycle runs. Steady state costs no CPU, and edits are picked
+        up in well under the polling interval.
+        """
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+
+        class _MarkdownHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory or not str(event.src_path).endswith('.md'):
+                    return
+                loop.call_soon_threadsafe(events.put_nowait, event.src_path)
+
+        observer = Observer()
+        observer.schedule(_MarkdownHandler(), str(self.doc_root), recursive=True)
+        observer.start()
+        logger.info("Watching for markdown changes (event-driven)")
+
+        try:
+            # Initial pass so pre-existing documents get processed
+            await self.update_documentation_cycle()
+
+            while True:
+                await events.get()
+                # Debounce: drain follow-up events from the same burst
+                while True:
+                    try:
+                        await asyncio.wait_for(events.get(), timeout=0.2)
+                    except asyncio.TimeoutError:
+                        break
+                try:
+                    await self.update_documentation_cycle()
+                except Exception as e:
+                    logger.error(f"Error in documentation update cycle: {e}")
+        finally:
+            observer.stop()
+            observer.join()
+
     async def update_documentation_cycle(self):
         """One complete cycle of documentation monitoring and updating."""
 
-        # Find all markdown files
-        markdown_files = list(self.doc_root.glob("**/*.md"))
-        logger.debug(f"Found {len(markdown_files)} markdown files to process")
-
-        # Check for changes and update hyperlinks
-        for doc_path in markdown_files:
+        # Collect changed documents, then update them concurrently: each
+        # document's read/extract/write is independent and I/O-bound, so
+        # fanning out with bounded concurrency scales the cycle with the
+        # number of workers instead of serializing every file
+        changed = []
+        found = 0
+        for doc_path in self._scan_markdown_files():
+            found += 1
             if await self.has_document_changed(doc_path):
-                await self.update_document_hyperlinks(doc_path)
-                logger.debug(f"Updated hyperlinks for {doc_path}")
+                changed.append(doc_path)
+        logger.debug(f"Scanned {found} markdown files, {len(changed)} changed")
+
+        if not changed:
+            return
+
+        await self._run_update_pipeline(changed)
+
+    async def _run_update_pipeline(self, changed: List[Path]):
+        """Process changed documents as a three-stage pipeline.
+
+        Reader, extraction workers, and writer run as coroutines connected
+        by bounded queues, so extraction overlaps with both reads and
+        writes instead of each document paying read, process, and write in
+        sequence. The queue bounds provide back-pressure: a slow disk
+        cannot pile unprocessed documents into memory.
+        """
+        read_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        write_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
+        num_workers = os.cpu_count() or 1
+
+        async def reader():
+            for doc_path in changed:
+                try:
+                    content = await asyncio.to_thread(
+                        doc_path.read_text, encoding='utf-8', errors='ignore')
+                except OSError as e:
+                    logger.error(f"Error reading {doc_path}: {e}")
+                    continue
+                await read_queue.put((doc_path, content))
+            for _ in range(num_workers):
+                await read_queue.put(None)
+
+        async def processor():
+            while True:
+                item = await read_queue.get()
+                if item is None:
+                    break
+                doc_path, content = item
+                try:
+                    updated_content = await self._hyperlink_content(doc_path, content)
+                except Exception as e:
+                    logger.error(f"Error updating hyperlinks for {doc_path}: {e}")
+                    continue
+                await write_queue.put((doc_path, updated_content))
+
+        async def writer():
+            while True:
+                item = await write_queue.get()
+                if item is None:
+                    break
+                doc_path, updated_content = item
+                try:
+                    await asyncio.to_thread(
+                        self.save_hyperlinked_document, doc_path, updated_content)
+                except OSError as e:
+                    logger.error(f"Error writing hyperlinks for {doc_path}: {e}")
+
+        writer_task = asyncio.create_task(writer())
+        await asyncio.gather(reader(), *(processor() for _ in range(num_workers)))
+        await write_queue.put(None)
+        await writer_task
+
+    def _scan_markdown_files(self):
+        """Yield every markdown file under doc_root.
+
+        Iterative ``os.scandir`` walk instead of ``glob("**/*.md")``: no
+        pathlib wrapper per entry, and each directory's listing is cached
+        keyed by its mtime, so unchanged directories are re-walked from the
+        cache without touching the filesystem again. (A directory's mtime
+        only moves on create/delete/rename; content edits are caught by the
+        per-file stat in has_document_changed.)
+        """
+        stack = [str(self.doc_root)]
+        while stack:
+            current = stack.pop()
+            try:
+                dir_mtime = os.stat(current).st_mtime_ns
+            except OSError:
+                self._dir_cache.pop(current, None)
+                continue
+
+            cached = self._dir_cache.get(current)
+            if cached is not None and cached[0] == dir_mtime:
+                subdirs, files = cached[1], cached[2]
+            else:
+                subdirs, files = [], []
+                try:
+                    with os.scandir(current) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False):
+                                    subdirs.append(entry.path)
+                                elif entry.is_file() and entry.name.endswith('.md'):
+                                    files.append(entry.path)
+                            except OSError:
+                                continue
+                except OSError as e:
+                    logger.warning(f"Cannot scan directory {current}: {e}")
+                    continue
+                self._dir_cache[current] = (dir_mtime, subdirs, files)
+
+            stack.extend(subdirs)
+            for file_path in files:
+                yield Path(file_path)
 
     async def has_document_changed(self, doc_path: Path) -> bool:
         """Check if document has changed since last processing."""
         try:
-            current_content = doc_path.read_text(encoding='utf-8', errors='ignore')
-            current_hash = hashlib.md5(current_content.encode()).hexdigest()
-
-            previous_hash = self.document_hashes.get(str(doc_path))
-            if previous_hash != current_hash:
-                self.document_hashes[str(doc_path)] = current_hash
-                return True
-
-            return False
+            key = str(doc_path)
+
+            # A file whose mtime and size both match the last cycle has not
+            # changed; skipping the read makes the steady-state cycle cost
+            # one stat() per file instead of a full read and hash
+            st = doc_path.stat()
+            stat_sig = (st.st_mtime_ns, st.st_size)
+            if stat_sig == self.document_stats.get(key):
+                return False
+
+            # Hash the raw bytes in fixed-size chunks: no UTF-8 decode is
+            # needed for change detection and memory stays constant even
+            # for very large documents
+            current_hash = _hash_file(doc_path)
+            self.document_stats[key] = stat_sig
+
+            previous_hash = self.document_hashes.get(key)
+            changed = previous_hash != current_hash
+            if changed:
+                self.document_hashes[key] = current_hash
+
+            # Write-through so the next process start inherits this state
+            self._hyperlink_cache.put_state(
+                key, current_hash, stat_sig[0], stat_sig[1],
+                self.hyperlinked_docs.get(key))
+
+            return changed
         except Exception as e:
             logger.warning(f"Error checking changes for {doc_path}: {e}")
             return False
@@ -330,62 +784,128 @@ class DocumentationMCPServer:
     async def update_document_hyperlinks(self, doc_path: Path):
         """Update hyperlinks in a specific document."""
         try:
-            # Read document
-            content = doc_path.read_text(encoding='utf-8', errors='ignore')
+            # Read document off the event loop so other documents progress
+            # while this one waits on disk
+            content = await asyncio.to_thread(
+                doc_path.read_text, encoding='utf-8', errors='ignore')
 
-            # Extract entities
-            entities = await self.extract_entities_from_document(doc_path, content)
+            # Extract, hyperlink, and insert (served from the output cache
+            # when this content was already processed under this vocabulary)
+            updated_content = await self._hyperlink_content(doc_path, content)
 
-            # Generate hyperlinks
-            hyperlinks = await self.generate_hyperlinks(entities)
+            # Save hyperlinked version (blocking mkdir/write, also off-loop)
+            await asyncio.to_thread(
+                self.save_hyperlinked_document, doc_path, updated_content)
 
-            # Insert hyperlinks into content
-            updated_content = self.insert_hyperlinks(content, hyperlinks)
-
-            # Save hyperlinked version
-            self.save_hyperlinked_document(doc_path, updated_content)
-
-            logger.debug(f"Generated {len(hyperlinks)} hyperlinks for {doc_path}")
+            logger.debug(f"Updated hyperlinks for {doc_path}")
 
         except Exception as e:
             logger.error(f"Error updating hyperlinks for {doc_path}: {e}")
 
+    async def _hyperlink_content(self, doc_path: Path, content: str) -> str:
+        """Produce the hyperlinked version of content, via the output cache."""
+        key = _hash_digest(content.encode()) + self._vocab_hash
+        cached = self._hyperlink_cache.get(key)
+        if cached is not None:
+            return cached.decode('utf-8')
+
+        # CPU-bound scan and insert run on the process pool so concurrent
+        # documents scale past the GIL instead of serializing on it
+        loop = asyncio.get_running_loop()
+        updated_content = await loop.run_in_executor(
+            self._pool, _process_document,
+            str(self.doc_root), self.kg_client.server_uri, content)
+
+        self._hyperlink_cache.put(key, updated_content.encode())
+        return updated_content
+
     async def extract_entities_from_document(self, doc_path: Path, content: str) -> List[EntityMention]:
         """Extract entity mentions from document content."""
 
         entities = []
 
-        # Define entity patterns (expand as needed)
-        entity_patterns = [
-            r'\b(Injection_Pipeline|Knowledge_Graph_Processing|Deterministic_Routing_Engine|Template_Generation_System|Hybrid_Search_Fusion_Engine|Core_Orchestration_Framework)\b',
-            r'\b(Doc(ument_)?Parser|Entity_Extractor|Content_Chunker)\b',
-            r'\b(Graph_Constructor|Graph_Algorithms|Relationship_Fusion)\b',
-            r'\b(Intent_Classifier|Processing_Router|Content_Filter)\b',
-            r'\b(Template_Generator|Response_Builder|Format_Optimizer)\b',
-            r'\b(Vector_Retriever|Graph_Traverser|Result_Fusion)\b',
-            r'\b(Pipeline_Manager|Memory_Manager)\b',
-            r'\b(ROMILLM|ROMILLM_Architecture)\b',
-        ]
-
-        lines = content.split('\n')
-
-        for line_num, line in enumerate(lines, 1):
-            for pattern in entity_patterns:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    # Check if not already inside a link
-                    if not self.is_inside_markdown_link(line, match.start(), match.end()):
-                        entity = EntityMention(
-                            name=match.group(),
-                            line=line_num,
-                            start_pos=match.start(),
-                            end_pos=match.end(),
-                            context=self.determine_context(line, match.group()),
-                            surrounding_text=line[max(0, match.start()-50):min(len(line), match.end()+50)]
-                        )
-                        entities.append(entity)
+        # Newline offsets let bisect map a match position to its line number
+        # without splitting the document
+        newline_offsets = _newline_index(content)
+        link_mask = self._link_mask(content)
+
+        # One pass over the whole document
+        for span_start, span_end, name in self._iter_entity_spans(content):
+            line_idx = bisect_right(newline_offsets, span_start)
+            line_start = newline_offsets[line_idx - 1] + 1 if line_idx else 0
+            line_end = (newline_offsets[line_idx]
+                        if line_idx < len(newline_offsets) else len(content))
+            line = content[line_start:line_end]
+            start = span_start - line_start
+            end = span_end - line_start
+
+            # Check if not already inside a link (O(1) mask lookup)
+            if not link_mask[span_start]:
+                entity = EntityMention(
+                    name=name,
+                    line=line_idx + 1,
+                    start_pos=start,
+                    end_pos=end,
+                    context=self.determine_context(line, name),
+                    surrounding_text=line[max(0, start-50):min(len(line), end+50)],
+                    doc_start=span_start,
+                    doc_end=span_end
+                )
+                entities.append(entity)
 
         return entities
 
+    def _iter_entity_spans(self, content: str):
+        """Yield (start, end, matched_text) for every entity occurrence.
+
+        Uses the Aho-Corasick automaton when available — a single DFA pass
+        over the content, linear in its length regardless of vocabulary
+        size — with explicit word-boundary checks since the automaton
+        matches raw substrings. Falls back to the compiled alternation.
+        """
+        if self._ac is not None:
+            n = len(content)
+            for end_idx, name in self._ac.iter(content):
+                start = end_idx - len(name) + 1
+                before = content[start - 1] if start > 0 else ''
+                after = content[end_idx + 1] if end_idx + 1 < n else ''
+                if before and (before.isalnum() or before == '_'):
+                    continue
+                if after and (after.isalnum() or after == '_'):
+                    continue
+                yield start, end_idx + 1, content[start:end_idx + 1]
+        else:
+            for match in self._entity_re.finditer(content):
+                yield match.start(), match.end(), match.group()
+
+    def _link_mask(self, content: str) -> bytearray:
+        """Bitmap marking positions inside existing [text](url) markup.
+
+        One left-to-right prescan over the content; each candidate match is
+        then an O(1) mask lookup instead of an O(line) rfind/find probe,
+        taking the whole pass from O(length x matches) to O(length +
+        matches). Spans crossing a newline are not treated as links.
+        """
+        mask = bytearray(len(content))
+        find = content.find
+        i = 0
+        while True:
+            i = find('[', i)
+            if i == -1:
+                break
+            j = find('](', i + 1)
+            if j == -1:
+                break
+            k = find(')', j + 2)
+            if k == -1:
+                break
+            if find('\n', i, k) != -1:
+                i += 1
+                continue
+            mask[i:k + 1] = b'\x01' * (k + 1 - i)
+            i = k + 1
+        return mask
+
     def is_inside_markdown_link(self, line: str, start: int, end: int) -> bool:
         """Check if match is already inside a Markdown link."""
         # Check if within [text](url) pattern
@@ -414,13 +934,56 @@ class DocumentationMCPServer:
         else:
             return "reference"
 
-    async def generate_hyperlinks(self, entities: List[EntityMention]) -> List[Hyperlink]:
+    def _scan_hyperlinks(self, content: str) -> List[Hyperlink]:
+        """Produce hyperlinks for a document in one fused synchronous pass.
+
+        Combines entity matching and graph lookup: each matched span is
+        resolved against the node-detail table inline and becomes a
+        Hyperlink directly, with no intermediate EntityMention list and no
+        coroutine frame per mention. This is the hot path the update
+        pipeline uses; extract_entities_from_document remains for callers
+        that want the mentions themselves.
+        """
+        hyperlinks = []
+        newline_offsets = _newline_index(content)
+        link_mask = self._link_mask(content)
+
+        for span_start, span_end, name in self._iter_entity_spans(content):
+            if link_mask[span_start]:
+                continue
+
+            # Matched text is a fresh slice; interning maps it back onto
+            # the canonical key object for the pointer-compare fast path
+            name = sys.intern(name)
+            node_details = self.kg_client.query_graph_node(name)
+            if node_details is None:
+                continue
+
+            line_idx = bisect_right(newline_offsets, span_start)
+            line_start = newline_offsets[line_idx - 1] + 1 if line_idx else 0
+            line_end = (newline_offsets[line_idx]
+                        if line_idx < len(newline_offsets) else len(content))
+            line = content[line_start:line_end]
+
+            hyperlinks.append(Hyperlink(
+                text=name,
+                href=f"graph://{name}",
+                line=line_idx + 1,
+                context=self.determine_context(line, name),
+                entity_details=node_details,
+                doc_start=span_start,
+                doc_end=span_end
+            ))
+
+        return hyperlinks
+
+    def generate_hyperlinks(self, entities: List[EntityMention]) -> List[Hyperlink]:
         """Generate hyperlinks for detected entities."""
         hyperlinks = []
 
         for entity in entities:
             # Query Knowledge Graph for entity details
-            node_details = await self.kg_client.query_graph_node(entity.name)
+            node_details = self.kg_client.query_graph_node(entity.name)
 
             if node_details:
                 hyperlink = Hyperlink(
@@ -428,69 +991,88 @@ class DocumentationMCPServer:
                     href=f"graph://{entity.name}",
                     line=entity.line,
                     context=entity.context,
-                    entity_details=node_details
+                    entity_details=node_details,
+                    doc_start=entity.doc_start,
+                    doc_end=entity.doc_end
                 )
                 hyperlinks.append(hyperlink)
 
         return hyperlinks
 
     def insert_hyperlinks(self, content: str, hyperlinks: List[Hyperlink]) -> str:
-        """Insert hyperlinks into document content."""
-        lines = content.split('\n')
-        hyperlink_by_line = {}
-
-        # Group hyperlinks by line
-        for link in hyperlinks:
-            if link.line not in hyperlink_by_line:
-                hyperlink_by_line[link.line] = []
-            hyperlink_by_line[link.line].append(link)
-
-        # Process each line
-        for line_num, line in enumerate(lines, 1):  # 1-indexed
-            if line_num in hyperlink_by_line:
-                line_hyperlinks = sorted(hyperlink_by_line[line_num], key=lambda x: x.text.count(' '), reverse=True)  # Process longer names first
-
-                for hyperlink in line_hyperlinks:
-                    # Skip if already a hyperlink
-                    if self.is_inside_markdown_link(line, 0, len(line)):
-                        continue
-
-                    # Create Markdown link
-                    link_text = f"[{hyperlink.text}]({hyperlink.href})"
-
-                    # Replace first occurrence of the entity name
-                    # Use word boundaries to avoid partial replacements
-                    pattern = r'\b' + re.escape(hyperlink.text) + r'\b'
-
-                    # Replace only if not already in a link
-                    if f"[{hyperlink.text}](" not in line:
-                        line = re.sub(pattern, link_text, line, count=1)
-
-                lines[line_num - 1] = line
-
-        return '\n'.join(lines)
+        """Insert hyperlinks into document content.
+
+        Single linear pass: the hyperlinks carry the document-level match
+        spans produced during extraction, so the content is rebuilt by
+        splicing link markup at those offsets — no per-line re.sub and no
+        second scan for the entity names.
+        """
+        if not hyperlinks:
+            return content
+
+        parts = []
+        prev = 0
+        for link in sorted(hyperlinks, key=lambda l: l.doc_start):
+            # Drop spans without offsets and any overlapping an earlier one
+            if link.doc_start < prev or link.doc_start < 0:
+                continue
+            # Already inside link markup
+            if link.doc_start > 0 and content[link.doc_start - 1] == '[':
+                continue
+
+            parts.append(content[prev:link.doc_start])
+            parts.append('[')
+            parts.append(content[link.doc_start:link.doc_end])
+            parts.append('](')
+            parts.append(link.href)
+            parts.append(')')
+            prev = link.doc_end
+
+        parts.append(content[prev:])
+        return ''.join(parts)
 
     def save_hyperlinked_document(self, doc_path: Path, content: str):
         """Save the hyperlinked version of the document."""
-        # Create hyperlinked_docs directory if it doesn't exist
+        # Mirror the document structure under hyperlinked_docs/
         hyperlinked_dir = Path("hyperlinked_docs")
-        hyperlinked_dir.mkdir(exist_ok=True)
-
-        # Mirror the document structure
         relative_path = doc_path.relative_to(self.doc_root)
         hyperlinked_path = hyperlinked_dir / relative_path
 
-        # Create subdirectories if needed
-        hyperlinked_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create subdirectories once per unique parent instead of paying
+        # the mkdir syscalls on every save
+        parent = hyperlinked_path.parent
+        if str(parent) not in self._made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._made_dirs.add(str(parent))
 
         # Save the hyperlinked document
         hyperlinked_path.write_text(content, encoding='utf-8')
 
-        # Store reference
-        self.hyperlinked_docs[str(doc_path)] = str(hyperlinked_path)
+        # Store reference, persisted alongside the change-detection state
+        key = str(doc_path)
+        self.hyperlinked_docs[key] = str(hyperlinked_path)
+        stat_sig = self.document_stats.get(key)
+        if stat_sig is not None:
+            self._hyperlink_cache.put_state(
+                key, self.document_hashes.get(key, ''),
+                stat_sig[0], stat_sig[1], str(hyperlinked_path))
 
         logger.info(f"Saved hyperlinked document: {hyperlinked_path}")
 
+# Per-process server instance for pool workers; the matcher is built on the
+# first task and then reused for every document the worker receives
+_worker_server: Optional[DocumentationMCPServer] = None
+
+
+def _process_document(doc_root: str, kg_server_uri: str, content: str) -> str:
+    """Process-pool entry point: scan content and insert hyperlinks."""
+    global _worker_server
+    if _worker_server is None:
+        _worker_server = DocumentationMCPServer(doc_root, kg_server_uri)
+    hyperlinks = _worker_server._scan_hyperlinks(content)
+    return _worker_server.insert_hyperlinks(content, hyperlinks)
+
+
 async def main():
     """Main entry point with MCP protocol support."""
 
@@ -13,13 +13,16 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 import hashlib
 import shutil
+import string
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from enum import IntEnum
 
 # Configure logging
 logging.basicConfig(
@@ -28,18 +31,79 @@ logging.basicConfig(
 )
 logger = logging.getLogger("holy-tree-mcp-server")
 
-@dataclass
+# Compiled once at import: each call is then a direct C-level match with
+# no re-cache lookup
+_DOMAIN_NUM_RE = re.compile(r'^\d+$')
+
+_KEEP_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+
+def _clean_name(name: str) -> str:
+    """Map decoration characters to '_' without invoking the regex engine."""
+    if all(c in _KEEP_CHARS for c in name):
+        return name  # common case: already a clean identifier, no allocation
+    return ''.join(c if c in _KEEP_CHARS or c.isalnum() else '_' for c in name).strip('_')
+
+_NUMBER_CHARS = frozenset('0123456789.')
+
+def _tokenize_tree_line(line: str) -> Optional[Tuple[str, str]]:
+    """Split a stripped tree line into (number, content-after-number).
+
+    This is the per-line tokenizer kernel: a single find plus one character
+    scan over the numbering prefix, with no regex machinery involved.
+    Returns None for lines that are not numbered tree nodes.
+    """
+    marker = line.find('──')
+    if marker == -1:
+        return None
+    content = line[marker + 2:].lstrip()
+    i = 0
+    n = len(content)
+    while i < n and content[i] in _NUMBER_CHARS:
+        i += 1
+    # Number must be non-empty, dot-separated digit groups, followed by space
+    if i == 0 or i == n or not content[i].isspace():
+        return None
+    number = content[:i]
+    if number[0] == '.' or number[-1] == '.' or '..' in number:
+        return None
+    return number, content[i:].strip()
+
+def _domain_index_key(line: str) -> Optional[str]:
+    """Clean domain name from a tree line, with any trailing comment dropped.
+
+    The domain line index must be addressable by the bare name callers pass
+    to add/remove (e.g. 'CoreDomain'), so the '#'-comment text that
+    _parse_ascii_line folds into entity names is stripped before cleaning.
+    """
+    token = _tokenize_tree_line(line.strip())
+    if token is None:
+        return None
+    content = token[1].split('#', 1)[0]
+    return _clean_name(content.replace('📁', '').replace('/', '').strip())
+
+class HolyTreeType(IntEnum):
+    """Entity kind codes; integer compares keep the hot loops cheap."""
+    DOMAIN = 0
+    OBJECT = 1
+    LAYER = 2
+
+_TYPE_NAMES = ('domain', 'object', 'layer')
+
+@dataclass(slots=True)
 class HolyTreeEntity:
     """Represents an entity in the Holy Tree structure."""
     name: str
-    type: str  # 'domain', 'object', 'layer'
+    type: HolyTreeType
     number: str
     level: int
     parent_path: str
     classification: Dict
     ascii_line: str
+    line_num: int = 0  # 1-based line in ProjectStructure.md
+    parent_number: str = ''  # '' for top-level domains
+    dir_path: Optional[Path] = None  # project-relative path, set by _build_indices
 
-@dataclass
+@dataclass(slots=True)
 class HolyTreeStatistics:
     """Statistics about Holy Tree structure."""
     total_domains: int = 0
@@ -58,23 +122,49 @@ class HolyTreeParser:
         self.holy_tree_path = Path(holy_tree_path)
         self.entities = {}
         self.stats = HolyTreeStatistics()
+        # Line-level view of the tree file, kept in sync by incremental edits
+        self._lines: List[str] = []
+        self._domain_line_index: Dict[str, Tuple[int, int]] = {}
+        # Content-hash parse cache: reparse only when the file bytes change
+        self._cache_hash: Optional[bytes] = None
+        self._cache_result: Optional[Dict[str, Any]] = None
+        # Side indices rebuilt by _build_indices
+        self._by_level: Dict[int, List[HolyTreeEntity]] = {}
+        self._children: Dict[str, List[str]] = {}
         logger.info(f"HolyTree Parser initialized for {holy_tree_path}")
 
     def parse_holy_tree(self) -> Dict[str, Any]:
         """Parse the complete Holy Tree structure into structured data."""
         try:
-            content = self.holy_tree_path.read_text(encoding='utf-8', errors='ignore')
+            # Stream the file once: each raw line feeds the content hash and
+            # is decoded individually, so the whole file is never held twice
+            # (full str plus line list) in memory
+            lines = []
+            hasher = hashlib.blake2b(digest_size=16)
+            raw = b''
+            with self.holy_tree_path.open('rb') as f:
+                for raw in f:
+                    hasher.update(raw)
+                    lines.append(raw.decode('utf-8', errors='ignore').rstrip('\n'))
+            if raw.endswith(b'\n'):
+                lines.append('')  # preserve the trailing newline on rewrite
+
+            content_hash = hasher.digest()
+            if content_hash == self._cache_hash and self._cache_result is not None:
+                return self._cache_result
 
             # Reset stats
             self.stats = HolyTreeStatistics()
             self.entities = {}
+            self._domain_line_index = {}
 
-            # Split into lines and parse structure
-            lines = content.split('\n')
+            self._lines = lines
             current_path = []
+            open_domain = None  # (name, start line index)
 
             for line_num, line in enumerate(lines, 1):
-                if not line.strip() or line.strip().startswith('#'):
+                stripped = line.strip()
+                if not stripped or stripped[0] == '#':
                     continue
 
                 entity = self._parse_ascii_line(line, line_num, current_path)
@@ -82,22 +172,31 @@ class HolyTreeParser:
                     self.entities[entity.number] = entity
 
                     # Update path for nested items
-                    if entity.type == 'domain':
+                    if entity.type == HolyTreeType.DOMAIN:
+                        if open_domain:
+                            self._domain_line_index[open_domain[0]] = (open_domain[1], line_num - 1)
+                        # Index on the comment-stripped name so lookups by
+                        # bare domain name (add/remove) find the block
+                        domain_key = _domain_index_key(line) or entity.name
+                        open_domain = (domain_key, line_num - 1)
                         current_path = [entity.number]
-                    elif entity.type == 'object':
+                    elif entity.type == HolyTreeType.OBJECT:
                         current_path = [entity.number.split('.')[0], entity.number]
-                    elif entity.type == 'layer' and len(current_path) >= 2:
+                    elif entity.type == HolyTreeType.LAYER and len(current_path) >= 2:
                         current_path = [current_path[0], current_path[1], entity.number]
 
-            # Update statistics
-            self._update_statistics()
+            if open_domain:
+                self._domain_line_index[open_domain[0]] = (open_domain[1], len(lines))
+
+            # Update statistics and side indices
+            self._build_indices()
 
             result = {
                 "parsed_successfully": True,
                 "entities_count": len(self.entities),
-                "domains": sum(1 for e in self.entities.values() if e.type == 'domain'),
-                "objects": sum(1 for e in self.entities.values() if e.type == 'object'),
-                "layers": sum(1 for e in self.entities.values() if e.type == 'layer'),
+                "domains": self.stats.total_domains,
+                "objects": self.stats.total_objects,
+                "layers": self.stats.total_layers,
                 "max_depth": self.stats.tree_depth,
                 "statistics": {
                     "total_domains": self.stats.total_domains,
@@ -107,6 +206,9 @@ class HolyTreeParser:
                 }
             }
 
+            self._cache_hash = content_hash
+            self._cache_result = result
+
             logger.info(f"Holy Tree parsed successfully: {result}")
             return result
 
@@ -119,24 +221,17 @@ class HolyTreeParser:
         original_line = line
         line = line.strip()
 
-        # Skip lines that don't look like tree nodes
-        if not any(symbol in line for symbol in ['├──', '└──']):
+        # Skip lines that don't look like tree nodes: a single substring scan
+        # rejects blanks, headers and pure-pipe continuation lines up front
+        if '──' not in line:
             return None
 
-        # Find the structural part and content - more robust regex
-        content_match = re.search(r'[├└]──\s*(.+)$', line)
-        if not content_match:
-            return None
-
-        content = content_match.group(1).strip()
-
-        # Extract entity information - handle numbering
-        number_match = re.search(r'^([\d]+(?:\.[\d]+)*(?:\.[1-5])?)\s+', content)
-        if not number_match:
+        # Tokenize the structural part and numbering in one pass
+        token = _tokenize_tree_line(line)
+        if token is None:
             return None
 
-        number = number_match.group(1)
-        entity_content = content.replace(number, '').strip()
+        number, entity_content = token
 
         # Safety check for entity content
         if not entity_content:
@@ -150,17 +245,17 @@ class HolyTreeParser:
 
         # Determine entity type by hierarchical context and content
         if len(number.split('.')) == 1 and '📁' in entity_content:
-            entity_type = 'domain'
+            entity_type = HolyTreeType.DOMAIN
             name = iconless_content
         elif len(number.split('.')) >= 2 and '📁' in entity_content:
-            entity_type = 'object'
+            entity_type = HolyTreeType.OBJECT
             name = iconless_content
         else:
-            entity_type = 'layer'
+            entity_type = HolyTreeType.LAYER
             name = iconless_content
 
         # Clean up name (remove icons and decorations but preserve structure)
-        name = re.sub(r'[^\w_]', '_', name).strip('_')
+        name = _clean_name(name)
         if not name:  # Ensure name is not empty
             return None
 
@@ -177,20 +272,47 @@ class HolyTreeParser:
             level=len(number.split('.')),
             parent_path=parent_path,
             classification={},  # Will be populated by classifier
-            ascii_line=original_line  # Use original line for accuracy
+            ascii_line=original_line,  # Use original line for accuracy
+            line_num=line_num,
+            parent_number=number.rpartition('.')[0]
         )
 
-    def _update_statistics(self):
-        """Update Holy Tree statistics."""
-        self.stats.total_domains = sum(1 for e in self.entities.values() if e.type == 'domain')
-        self.stats.total_objects = sum(1 for e in self.entities.values() if e.type == 'object')
-        self.stats.total_layers = sum(1 for e in self.entities.values() if e.type == 'layer')
-        self.stats.tree_depth = max((e.level for e in self.entities.values()), default=0)
+    def _build_indices(self):
+        """Rebuild statistics, level/children indices and entity paths in one pass."""
+        domains = objects = layers = depth = 0
+        self._by_level = {}
+        self._children = {}
+
+        for entity in self.entities.values():
+            entity_type = entity.type
+            if entity_type == HolyTreeType.DOMAIN:
+                domains += 1
+            elif entity_type == HolyTreeType.OBJECT:
+                objects += 1
+            else:
+                layers += 1
+            if entity.level > depth:
+                depth = entity.level
+            self._by_level.setdefault(entity.level, []).append(entity)
+
+            if entity.level == 1:
+                entity.dir_path = Path(entity.name)
+            else:
+                self._children.setdefault(entity.parent_number, []).append(entity.number)
+                parent = self.entities.get(entity.parent_number)
+                # Entities are parsed top-down, so the parent chain is resolved
+                entity.dir_path = parent.dir_path / entity.name \
+                    if parent and parent.dir_path else None
+
+        self.stats.total_domains = domains
+        self.stats.total_objects = objects
+        self.stats.total_layers = layers
+        self.stats.tree_depth = depth
         self.stats.last_updated = datetime.now(timezone.utc)
 
     def get_entities_by_level(self, level: int) -> List[HolyTreeEntity]:
         """Get all entities at a specific level."""
-        return [entity for entity in self.entities.values() if entity.level == level]
+        return list(self._by_level.get(level, []))
 
     def get_entity_by_number(self, number: str) -> Optional[HolyTreeEntity]:
         """Get entity by its hierarchical number."""
@@ -200,17 +322,15 @@ class HolyTreeParser:
         """Validate Holy Tree structural integrity."""
         issues = []
 
-        # Check for missing parents
-        for number, entity in self.entities.items():
-            if entity.level > 1:
-                parent_number = '.'.join(number.split('.')[:-1])
-                if parent_number not in self.entities:
-                    issues.append(f"Missing parent for {number}: parent {parent_number} not found")
+        # Check for missing parents with one set difference over the key view
+        needed = {e.parent_number for e in self.entities.values() if e.level > 1}
+        for parent_number in sorted(needed - self.entities.keys()):
+            issues.append(f"Missing parent: {parent_number} not found")
 
         # Check numerical consistency
         domain_numbers = [e.number for e in self.get_entities_by_level(1)]
         for num in domain_numbers:
-            if not num.match(r'^\d+$'):
+            if not _DOMAIN_NUM_RE.match(num):
                 issues.append(f"Invalid domain number format: {num}")
 
         return {
@@ -227,6 +347,8 @@ class HolyTreeProjectGenerator:
     def __init__(self, holy_tree_parser: HolyTreeParser):
         self.parser = holy_tree_parser
         self.project_root = Path("ROMILLM_Project")
+        # README writes are tiny and independent; overlap them in threads
+        self._io_pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="readme-io")
         logger.info("HolyTree Project Generator initialized")
 
     async def generate_project_from_holy_tree(self, create_mode: str = "incremental") -> Dict[str, Any]:
@@ -251,18 +373,40 @@ class HolyTreeProjectGenerator:
         generated_files = []
 
         try:
-            # Generate directory structure
-            for entity_number, entity in self.parser.entities.items():
-                if entity.type in ['domain', 'object', 'layer']:
-                    dir_path = self._construct_directory_path(entity)
-                    if create_mode == "full" or not dir_path.exists():
-                        dir_path.mkdir(parents=True, exist_ok=True)
+            # Flat mkdir sweep: unique paths, shallow first, so every parent
+            # already exists and each directory costs exactly one syscall
+            entity_dirs = {}
+            for entity in self.parser.entities.values():
+                if entity.type <= HolyTreeType.LAYER:
+                    entity_dirs[self._construct_directory_path(entity)] = entity
+
+            created = set()
+            for dir_path in sorted([self.project_root, *entity_dirs],
+                                   key=lambda p: len(p.parts)):
+                try:
+                    os.mkdir(dir_path)
+                    created.add(dir_path)
+                except FileExistsError:
+                    pass
+
+            readme_todo = []
+            for dir_path, entity in entity_dirs.items():
+                if dir_path in created or create_mode == "full":
+                    if dir_path in created:
                         created_directories.append(str(dir_path))
 
-                        # Generate basic files for structure
-                        if entity.type in ['domain', 'object']:
-                            await self._generate_basic_files(entity, dir_path)
-                            generated_files.append(f"{dir_path}/README.md")
+                    # Generate basic files for structure
+                    if entity.type <= HolyTreeType.OBJECT:
+                        readme_todo.append((entity, dir_path))
+                        generated_files.append(f"{dir_path}/README.md")
+
+            # Fan the blocking writes out to the I/O pool and await the batch
+            if readme_todo:
+                loop = asyncio.get_running_loop()
+                await asyncio.gather(*[
+                    loop.run_in_executor(self._io_pool, self._write_readme_sync, e, p)
+                    for e, p in readme_todo
+                ])
 
             return {
                 "success": True,
@@ -283,18 +427,21 @@ class HolyTreeProjectGenerator:
     def _construct_directory_path(self, entity: HolyTreeEntity) -> Path:
         """Construct the full directory path for an entity."""
 
-        # Build path from Holy Tree hierarchy
+        if entity.dir_path is not None:
+            return self.project_root / entity.dir_path
+
+        # Build path from Holy Tree hierarchy (fallback for unindexed entities)
         path_parts = []
 
-        if entity.type == 'domain':
+        if entity.type == HolyTreeType.DOMAIN:
             path_parts = [entity.name]
-        elif entity.type == 'object':
+        elif entity.type == HolyTreeType.OBJECT:
             # Find parent domain
             domain_number = entity.number.split('.')[0]
             domain_entity = self.parser.get_entity_by_number(domain_number)
             if domain_entity:
                 path_parts = [domain_entity.name, entity.name]
-        elif entity.type == 'layer':
+        elif entity.type == HolyTreeType.LAYER:
             # Find parent object and domain
             parts = entity.number.split('.')
             if len(parts) >= 2:
@@ -309,22 +456,41 @@ class HolyTreeProjectGenerator:
 
         return self.project_root / Path(*path_parts)
 
-    async def _generate_basic_files(self, entity: HolyTreeEntity, dir_path: Path):
+    def _write_readme_sync(self, entity: HolyTreeEntity, dir_path: Path):
         """Generate basic files for domain/object directories."""
 
         # Generate README.md
         readme_content = f"# {entity.name}\n\n{entity.classification.get('description', 'Architecture component description')}\n\n"
 
-        if entity.type == 'domain':
+        if entity.type == HolyTreeType.DOMAIN:
             readme_content += f"## Domain Overview\n\nThis domain contains {entity.classification.get('objects_count', 0)} core objects.\n"
-        elif entity.type == 'object':
+        elif entity.type == HolyTreeType.OBJECT:
             readme_content += f"## Object Overview\n\nThis object implements the {entity.name} component.\n"
             readme_content += f"**Location:** {entity.number}\n"
             readme_content += f"**Layers:** {', '.join(entity.classification.get('layers', []))}\n"
 
         readme_path = dir_path / "README.md"
-        async with asyncio.Lock():
-            readme_path.write_text(readme_content, encoding='utf-8')
+        readme_path.write_text(readme_content, encoding='utf-8')
+
+    async def _apply_entity_create(self, numbers: List[str]) -> List[str]:
+        """Create directories (and basic files) for just-added entities.
+
+        Targeted counterpart of generate_project_from_holy_tree: touches only
+        the given entity numbers instead of re-deriving the whole project.
+        """
+        created = []
+        for number in numbers:
+            entity = self.parser.get_entity_by_number(number)
+            if not entity or entity.type > HolyTreeType.LAYER:
+                continue
+            dir_path = self._construct_directory_path(entity)
+            if not dir_path.exists():
+                dir_path.mkdir(parents=True, exist_ok=True)
+                created.append(str(dir_path))
+                if entity.type <= HolyTreeType.OBJECT:
+                    await asyncio.get_running_loop().run_in_executor(
+                        self._io_pool, self._write_readme_sync, entity, dir_path)
+        return created
 
     async def validate_project_structure(self) -> Dict[str, Any]:
         """Validate that project structure matches Holy Tree exactly."""
@@ -343,19 +509,16 @@ class HolyTreeProjectGenerator:
             validation_result["holy_tree_valid"] = False
             return validation_result
 
-        # Check expected directories exist
-        for entity_number, entity in self.parser.entities.items():
-            if entity.type in ['domain', 'object', 'layer']:
+        # Check expected directories exist; each path is constructed exactly
+        # once (the per-entity Path is precomputed during index build)
+        expected_paths = set()
+        for entity in self.parser.entities.values():
+            if entity.type <= HolyTreeType.LAYER:
                 expected_path = self._construct_directory_path(entity)
+                expected_paths.add(str(expected_path))
                 if not expected_path.exists():
                     validation_result["missing_directories"].append(str(expected_path))
 
-        # Check for unexpected directories (limited check)
-        expected_paths = set()
-        for entity in self.parser.entities.values():
-            if entity.type in ['domain', 'object', 'layer']:
-                expected_paths.add(str(self._construct_directory_path(entity)))
-
         # Update consistency score
         if validation_result["missing_directories"]:
             validation_result["project_structure_valid"] = False
@@ -371,6 +534,8 @@ class HolyTreeMCPServer:
     def __init__(self, holy_tree_path: str):
         self.parser = HolyTreeParser(holy_tree_path)
         self.generator = HolyTreeProjectGenerator(self.parser)
+        # Serializes Holy Tree file mutations across concurrent tool calls
+        self._write_lock = asyncio.Lock()
         logger.info("Holy Tree MCP Server initialized as SUPREME ARCHITECTURAL AUTHORITY")
 
     async def analyze_holy_tree(self) -> Dict[str, Any]:
@@ -398,113 +563,144 @@ class HolyTreeMCPServer:
             if not entity_name or not domain or not proposed_number:
                 return {"success": False, "error": "Missing required fields: entity_name, domain, proposed_number"}
 
-            # Read Holy Tree content
-            holy_tree_content = self.parser.holy_tree_path.read_text(encoding='utf-8', errors='ignore')
-            lines = holy_tree_content.split('\n')
+            # Patch the in-memory line view instead of re-reading the file
+            if not self.parser._lines:
+                self.parser.parse_holy_tree()
+            lines = self.parser._lines
+
+            domain_key = _clean_name(domain)
+            domain_range = self.parser._domain_line_index.get(domain_key)
+
+            # Generate ASCII lines for the new entity
+            if len(proposed_number.split('.')) == 2:  # Object level
+                if domain_range is None:
+                    return {"success": False, "error": f"Domain '{domain}' not found in Holy Tree"}
+                ascii_line = f"│   ├── {proposed_number} 📁 {entity_name}/          # 🎯 Object: {entity_config.get('description', 'New component')}"
+                new_lines = [ascii_line]
+                for i, layer in enumerate(layers, 1):
+                    new_lines.append(f"│   │   ├── {proposed_number}.{i} {layer}/                # 📦 Layer {i}: {layer}")
+                # Insert at the end of the domain block, before trailing blanks
+                insert_index = domain_range[1]
+                while insert_index > domain_range[0] + 1 and not lines[insert_index - 1].strip():
+                    insert_index -= 1
+            else:  # Domain level
+                ascii_line = f"├── {proposed_number} 📁 {entity_name}/          # 🎯 DOMAIN: {entity_config.get('description', 'New domain')}"
+                new_lines = [ascii_line, "│   └── 📄 README.md                # Domain constitution document"]
+                insert_index = max((end for _, end in self.parser._domain_line_index.values()),
+                                   default=len(lines))
+
+            lines[insert_index:insert_index] = new_lines
+
+            # Shift line bookkeeping below the splice point
+            shift = len(new_lines)
+            for name, (start, end) in self.parser._domain_line_index.items():
+                if start >= insert_index:
+                    self.parser._domain_line_index[name] = (start + shift, end + shift)
+                elif end >= insert_index:
+                    self.parser._domain_line_index[name] = (start, end + shift)
+            for existing in self.parser.entities.values():
+                if existing.line_num > insert_index:
+                    existing.line_num += shift
+
+            # Register just the new entities instead of a full reparse
+            domain_number = proposed_number.split('.')[0]
+            added_numbers = []
+            for offset, new_line in enumerate(new_lines):
+                path = [domain_number] if '.' not in proposed_number or offset == 0 else [domain_number, proposed_number]
+                entity = self.parser._parse_ascii_line(new_line, insert_index + offset + 1, path)
+                if entity:
+                    self.parser.entities[entity.number] = entity
+                    added_numbers.append(entity.number)
+            self.parser._build_indices()
+            if '.' not in proposed_number:
+                self.parser._domain_line_index[_clean_name(entity_name)] = \
+                    (insert_index, insert_index + shift)
 
-            # Find insertion point in domain
-            insert_index = -1
-            for i, line in enumerate(lines):
-                if f'{domain}/' in line and proposed_number.startswith(line.strip().split()[0]):
-                    insert_index = i + 1
-                    break
+            async with self._write_lock:
+                self._write_holy_tree()
 
-            if insert_index == -1:
-                # Find domain end
-                domain_start = -1
-                for i, line in enumerate(lines):
-                    if f'{domain}/' in line or f'{domain}/' in line:
-                        domain_start = i
-                        break
-
-                if domain_start != -1:
-                    # Find where domain ends (next domain or end)
-                    insert_index = domain_start + 1
-                    for i in range(domain_start + 1, len(lines)):
-                        if lines[i].strip().startswith('├── ') or lines[i].strip().startswith('└── '):
-                            # Look for next domain (single number)
-                            line_parts = lines[i].strip().split()
-                            if len(line_parts) > 0 and re.match(r'^\d+$', line_parts[0]):
-                                insert_index = i
-                                break
-                        insert_index = i + 1
-
-            if insert_index != -1:
-                # Generate ASCII line for new entity
-                if len(proposed_number.split('.')) == 2:  # Object level
-                    ascii_line = f"│   ├── {proposed_number} 📁 {entity_name}/          # 🎯 Object: {entity_config.get('description', 'New component')}"
-                    # Add layer lines
-                    layer_lines = []
-                    for i, layer in enumerate(layers, 1):
-                        layer_lines.append(f"│   │   ├── {proposed_number}.{i} {layer}/                # 📦 Layer {i}: {layer}")
-
-                    # Insert entity and layers
-                    lines.insert(insert_index, ascii_line)
-                    for layer_line in reversed(layer_lines):
-                        lines.insert(insert_index + 1, layer_line)
-
-                else:  # Domain level
-                    ascii_line = f"├── {proposed_number} 📁 {entity_name}/          # 🎯 DOMAIN: {entity_config.get('description', 'New domain')}"
-                    lines.insert(insert_index, ascii_line)
-                    lines.insert(insert_index + 1, f"│   └── 📄 README.md                # Domain constitution document")
-
-                # Write back to Holy Tree
-                updated_content = '\n'.join(lines)
-                async with asyncio.Lock():
-                    self.parser.holy_tree_path.write_text(updated_content, encoding='utf-8')
-
-                # Trigger project structure generation
-                project_result = await self.generate_project_structure("incremental")
-
-                return {
-                    "success": True,
-                    "entity_added": entity_name,
-                    "holy_tree_updated": True,
-                    "project_structure_generated": project_result.get("success", False),
-                    "number_assigned": proposed_number,
-                    "ascii_line_added": ascii_line[:50] + "..."
-                }
+            # Create only the new directories rather than regenerating everything
+            created = await self.generator._apply_entity_create(added_numbers)
+
+            return {
+                "success": True,
+                "entity_added": entity_name,
+                "holy_tree_updated": True,
+                "project_structure_generated": True,
+                "directories_created": created,
+                "number_assigned": proposed_number,
+                "ascii_line_added": ascii_line[:50] + "..."
+            }
 
         except Exception as e:
             logger.error(f"Error adding entity to Holy Tree: {e}")
             return {"success": False, "error": str(e)}
 
+    def _write_holy_tree(self):
+        """Persist the in-memory line view atomically via temp file + rename."""
+        path = self.parser.holy_tree_path
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text('\n'.join(self.parser._lines), encoding='utf-8')
+        os.replace(tmp, path)
+        # Entity state was patched in place; drop the stale cached parse result
+        self.parser._cache_hash = None
+        self.parser._cache_result = None
+
     async def remove_entity_from_holy_tree(self, entity_name: str, cleanup_mode: str = "archive") -> Dict[str, Any]:
         """Remove entity from Holy Tree and clean up all related structures - REAL IMPLEMENTATION."""
         try:
-            # Read Holy Tree content
-            holy_tree_content = self.parser.holy_tree_path.read_text(encoding='utf-8', errors='ignore')
-            lines = holy_tree_content.split('\n')
-
-            # Find entity lines to remove
-            lines_to_remove = []
-            entity_start_line = -1
-
-            for line_num, line in enumerate(lines):
-                if entity_name in line and ('📁' in line or '/' in line):
-                    entity_start_line = line_num
-                    # Find all related lines (including child layers)
-                    for check_line_num in range(line_num, len(lines)):
-                        check_line = lines[check_line_num].strip()
-                        if not check_line:
-                            continue
-                        # Stop at next entity (starts with number)
-                        if re.search(r'^\d+\.?\d*', check_line.split()[0] if check_line.split() else ''):
-                            break
-                        lines_to_remove.append(check_line_num)
-                    break
-
-            if entity_start_line == -1:
+            if not self.parser._lines:
+                self.parser.parse_holy_tree()
+            lines = self.parser._lines
+
+            # Locate the entity by its cleaned name, falling back to a source
+            # line match (names may carry trailing comment decorations)
+            clean_name = _clean_name(entity_name)
+            entity = next((e for e in self.parser.entities.values() if e.name == clean_name), None)
+            if entity is None:
+                entity = next((e for e in self.parser.entities.values()
+                               if entity_name in e.ascii_line and ('📁' in e.ascii_line or '/' in e.ascii_line)),
+                              None)
+            if entity is None:
                 return {"success": False, "error": f"Entity '{entity_name}' not found in Holy Tree"}
 
-            # Remove lines (from bottom up to preserve indices)
-            for line_num in reversed(sorted(set(lines_to_remove))):
-                lines.pop(line_num)
-
-            # Write back to Holy Tree
-            updated_content = '\n'.join(lines)
-            async with asyncio.Lock():
-                self.parser.holy_tree_path.write_text(updated_content, encoding='utf-8')
+            # The block spans the entity line plus descendant/decoration lines,
+            # ending at the next node that is not numbered under the entity
+            start = entity.line_num - 1
+            child_prefix = entity.number + '.'
+            end = start + 1
+            while end < len(lines):
+                token = _tokenize_tree_line(lines[end].strip())
+                if token is not None and not token[0].startswith(child_prefix):
+                    break
+                end += 1
+
+            removed_numbers = [num for num in self.parser.entities
+                               if num == entity.number or num.startswith(child_prefix)]
+            for num in removed_numbers:
+                del self.parser.entities[num]
+
+            del lines[start:end]
+            lines_removed = end - start
+
+            # Shift line bookkeeping above the removed block
+            if entity.type == HolyTreeType.DOMAIN:
+                # The index is keyed on the comment-stripped name, which may
+                # differ from entity.name when the line carries a comment
+                removed_key = _domain_index_key(entity.ascii_line) or entity.name
+                self.parser._domain_line_index.pop(removed_key, None)
+            for name, (d_start, d_end) in list(self.parser._domain_line_index.items()):
+                if d_start >= end:
+                    self.parser._domain_line_index[name] = (d_start - lines_removed, d_end - lines_removed)
+                elif d_end >= end:
+                    self.parser._domain_line_index[name] = (d_start, d_end - lines_removed)
+            for existing in self.parser.entities.values():
+                if existing.line_num > end:
+                    existing.line_num -= lines_removed
+            self.parser._build_indices()
+
+            async with self._write_lock:
+                self._write_holy_tree()
 
             # Handle cleanup modes
             cleanup_result = {"cleanup_mode": cleanup_mode}
@@ -528,7 +724,7 @@ class HolyTreeMCPServer:
                 "success": True,
                 "entity_removed": entity_name,
                 "holy_tree_updated": True,
-                "lines_removed": len(lines_to_remove),
+                "lines_removed": lines_removed,
                 "cleanup": cleanup_result
             }
 
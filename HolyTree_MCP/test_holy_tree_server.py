@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Regression tests for the Holy Tree MCP server."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from holy_tree_server import HolyTreeMCPServer
+
+_COMMENTED_TREE = """ROMILLM_Project/
+├── 1 📁 CoreDomain/                 # 🎯 DOMAIN: core stuff
+│   ├── 1.1 📁 Tokenizer/            # 🎯 Object: token handling
+│   │   ├── 1.1.1 Config/            # 📦 Layer 1: Config
+│   │   └── 1.1.2 Core/              # 💼 Layer 3: Core
+"""
+
+
+class AddEntityIntoParsedDomainTest(unittest.IsolatedAsyncioTestCase):
+    """Domains parsed from disk must be addressable by their bare name."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="holy-tree-test-")
+        tmp_path = Path(self._tmp.name)
+        self.tree_path = tmp_path / "ProjectStructure.md"
+        self.tree_path.write_text(_COMMENTED_TREE, encoding="utf-8")
+        self.server = HolyTreeMCPServer(str(self.tree_path))
+        self.server.generator.project_root = tmp_path / "ROMILLM_Project"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    async def test_add_object_under_commented_domain(self):
+        # The domain line carries a '#' comment; the index key must still
+        # be the bare cleaned name the caller passes in
+        await self.server.analyze_holy_tree()
+        self.assertIn("CoreDomain", self.server.parser._domain_line_index)
+
+        result = await self.server.add_entity_to_holy_tree({
+            "entity_name": "NewComponent",
+            "domain": "CoreDomain",
+            "proposed_number": "1.2",
+            "description": "Added under a domain parsed from disk"
+        })
+        self.assertTrue(result["success"], result)
+        self.assertEqual(result["number_assigned"], "1.2")
+        self.assertIn("1.2", self.server.parser.entities)
+
+    async def test_api_created_domain_survives_reparse(self):
+        # Domains written by the add API carry comments too; after a
+        # reparse (restart) they must remain addable
+        await self.server.add_entity_to_holy_tree({
+            "entity_name": "NewDomain",
+            "domain": "NewDomain",
+            "proposed_number": "2",
+            "description": "Created through the API"
+        })
+
+        restarted = HolyTreeMCPServer(str(self.tree_path))
+        restarted.generator.project_root = self.server.generator.project_root
+        await restarted.analyze_holy_tree()
+
+        result = await restarted.add_entity_to_holy_tree({
+            "entity_name": "LateComponent",
+            "domain": "NewDomain",
+            "proposed_number": "2.1",
+            "description": "Added after restart"
+        })
+        self.assertTrue(result["success"], result)
+
+    async def test_remove_domain_drops_index_entry(self):
+        await self.server.analyze_holy_tree()
+        result = await self.server.remove_entity_from_holy_tree(
+            "CoreDomain", cleanup_mode="preserve")
+        self.assertTrue(result["success"], result)
+        self.assertNotIn("CoreDomain", self.server.parser._domain_line_index)
+
+
+if __name__ == "__main__":
+    unittest.main()
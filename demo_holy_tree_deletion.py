@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Holy Tree Mutation Consequences Demo
+
+Shows what actually happens when entities are deleted from or renamed in
+the Holy Tree: which numbered entities disappear, how many source lines
+the tree loses, and what downstream structures (directories, READMEs,
+documentation links) are affected.
+
+Each demo works on a scratch copy of the canonical tree so running it
+never mutates ROMILLM_Architecture/ProjectStructure.md.
+
+Output is buffered: each demo builds its report in a list and emits it
+with a single sys.stdout.write instead of one print per line.
+"""
+
+import asyncio
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+_REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(_REPO_ROOT / "HolyTree_MCP"))
+
+from holy_tree_server import HolyTreeMCPServer
+
+_CANONICAL_TREE = _REPO_ROOT / "ROMILLM_Architecture" / "ProjectStructure.md"
+
+
+def _sandbox_server(sandbox: Path) -> HolyTreeMCPServer:
+    """Build a server over a scratch copy of the canonical Holy Tree."""
+    tree_copy = sandbox / "ProjectStructure.md"
+    shutil.copyfile(_CANONICAL_TREE, tree_copy)
+    server = HolyTreeMCPServer(str(tree_copy))
+    # Keep generated directories inside the sandbox as well
+    server.generator.project_root = sandbox / "ROMILLM_Project"
+    return server
+
+
+async def demonstrate_holy_tree_deletion_consequences() -> None:
+    """Delete an object from the Holy Tree and report everything it takes with it."""
+    out: List[str] = []
+    out.append("=" * 60)
+    out.append("🗑️  HOLY TREE DELETION CONSEQUENCES")
+    out.append("=" * 60)
+
+    with tempfile.TemporaryDirectory(prefix="holy-tree-demo-") as tmp:
+        server = _sandbox_server(Path(tmp))
+        before = await server.analyze_holy_tree()
+        out.append(f"Entities before: {before['entities_count']} "
+                   f"({before['domains']} domains, {before['objects']} objects, "
+                   f"{before['layers']} layers)")
+
+        await server.add_entity_to_holy_tree({
+            "entity_name": "DemoDomain",
+            "domain": "DemoDomain",
+            "proposed_number": "9",
+            "description": "Scratch domain for the demo"
+        })
+        add_result = await server.add_entity_to_holy_tree({
+            "entity_name": "DoomedComponent",
+            "domain": "DemoDomain",
+            "proposed_number": "9.1",
+            "description": "Component created only to be deleted"
+        })
+        out.append(f"Added sacrificial object: {add_result.get('entity_added')} "
+                   f"as {add_result.get('number_assigned')}")
+
+        removal = await server.remove_entity_from_holy_tree(
+            "DoomedComponent", cleanup_mode="preserve")
+        out.append("")
+        out.append("Deletion consequences:")
+        out.append(f"  • Tree lines removed: {removal.get('lines_removed')}")
+        out.append(f"  • Cleanup mode: {removal.get('cleanup', {}).get('cleanup_mode')}")
+
+        after = await server.analyze_holy_tree()
+        out.append(f"  • Entities after deletion: {after['entities_count']}")
+        out.append("  • The object and its five layer children left the tree "
+                   "in one block removal")
+        out.append("  • Orphaned downstream: directories, READMEs and doc links "
+                   "under the removed object no longer have a tree authority")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+async def demonstrate_rename_consequences() -> None:
+    """Rename an object (remove + re-add) and report what must follow the rename."""
+    out: List[str] = []
+    out.append("=" * 60)
+    out.append("✏️  HOLY TREE RENAME CONSEQUENCES")
+    out.append("=" * 60)
+
+    with tempfile.TemporaryDirectory(prefix="holy-tree-demo-") as tmp:
+        server = _sandbox_server(Path(tmp))
+
+        await server.add_entity_to_holy_tree({
+            "entity_name": "DemoDomain",
+            "domain": "DemoDomain",
+            "proposed_number": "9",
+            "description": "Scratch domain for the demo"
+        })
+        add_result = await server.add_entity_to_holy_tree({
+            "entity_name": "OldName",
+            "domain": "DemoDomain",
+            "proposed_number": "9.1",
+            "description": "Component about to be renamed"
+        })
+        out.append(f"Created object: OldName as {add_result.get('number_assigned')}")
+
+        # A rename is a remove followed by a re-add under the new name;
+        # the number is reassigned, not preserved
+        removal = await server.remove_entity_from_holy_tree(
+            "OldName", cleanup_mode="preserve")
+        readd = await server.add_entity_to_holy_tree({
+            "entity_name": "NewName",
+            "domain": "DemoDomain",
+            "proposed_number": "9.1",
+            "description": "Renamed component"
+        })
+
+        out.append("")
+        out.append("Rename consequences:")
+        out.append(f"  • Old entity block removed: {removal.get('lines_removed')} lines")
+        out.append(f"  • New entity registered: {readd.get('entity_added')} "
+                   f"as {readd.get('number_assigned')}")
+        out.append(f"  • Directories created under the new name: "
+                   f"{len(readd.get('directories_created', []))}")
+        out.append("  • Every mapping, hyperlink and README keyed on the old "
+                   "name is now stale and must be regenerated")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+async def main() -> None:
+    # The demos use independent sandboxes and each flushes its report in
+    # one write, so they can run concurrently without interleaving output
+    await asyncio.gather(
+        demonstrate_holy_tree_deletion_consequences(),
+        demonstrate_rename_consequences(),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Integration Framework - Cross-MCP Coordination
+
+Binds the Code Analysis MCP to the Holy Tree authority: closing a source file
+triggers entity extraction, mapping onto the sacred layer structure,
+registration in the Holy Tree, and documentation synchronization.
+
+FILE CLOSED → EXTRACT ENTITIES → MAP TO HOLY TREE → REGISTER → HYPERLINK DOCS
+"""
+
+import asyncio
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+import logging
+
+# The MCP servers live in sibling directories, not packages
+_REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(_REPO_ROOT / "CodeAnalysisServer_MCP"))
+sys.path.insert(0, str(_REPO_ROOT / "HolyTree_MCP"))
+
+from mcp_server import CodeAnalysisServer
+from holy_tree_server import HolyTreeMCPServer, HolyTreeType
+
+logger = logging.getLogger("integration-framework")
+
+# Flush-worker batching: drain up to this many queued file events, or
+# whatever arrived inside the window, into one integration cycle
+_BATCH_MAX = 64
+_BATCH_WINDOW = 0.1  # seconds
+
+# The five sacred layers every object carries under ROMILLM_Project
+_VALID_LAYERS = frozenset({'Config', 'Toolbox', 'Core', 'Api', 'Tests'})
+
+@dataclass(slots=True, frozen=True)
+class CodeEntity:
+    """A code entity extracted from a closed source file."""
+    name: str
+    type: str  # 'class', 'function', 'method', 'member'
+    scope: str
+    file_path: str
+    line_number: int
+    parameters: Tuple[Dict, ...] = ()
+    return_type: str = ""
+    visibility: str = "public"
+
+# Not frozen: orphan marking flips status in place
+@dataclass(slots=True)
+class HolyTreeCodeEntityMapping:
+    """Tracks where a code entity lives inside the Holy Tree structure."""
+    code_entity_id: str
+    layer_path: str  # e.g. 'CoreDomain.Tokenizer.Core'
+    classification: str = "core_object"
+    status: str = "active"  # 'active' | 'orphaned'
+
+class CodeAnalysisHolyTreeIntegration:
+    """
+    Coordinates the Code Analysis MCP with the Holy Tree MCP.
+
+    Every file-closed event runs the full integration cycle: extract the
+    file's entities, bucket them by Holy Tree layer, register each layer
+    group, sync documentation, and mark mappings whose layer no longer
+    exists in the canon as orphaned.
+    """
+
+    def __init__(self, holy_tree_path: str = "ROMILLM_Architecture/ProjectStructure.md"):
+        self.code_analysis = CodeAnalysisServer()
+        self.holy_tree = HolyTreeMCPServer(holy_tree_path)
+        self.entity_mappings: Dict[str, HolyTreeCodeEntityMapping] = {}
+        # Layer path -> mapped entity ids, so orphan marking only touches
+        # the shards whose layer left the tree
+        self._by_layer_path: Dict[str, Set[str]] = {}
+        self.orphaned_entities: List[str] = []
+        # Layer-path cache, invalidated by bumping the version counter
+        self._tree_version = 0
+        self._layer_paths_cache: Optional[Tuple[int, Set[str]]] = None
+        # Directory -> (domain, object, layer) memo for
+        # _extract_layer_path_from_file
+        self._layer_path_cache: Dict[str, Optional[Tuple[str, str, str]]] = {}
+        # file path -> (mtime, size, entities); skips re-extraction when
+        # a file is closed again without changes
+        self._extract_cache: Dict[str, Tuple[float, int, List[CodeEntity]]] = {}
+        # Bounded event queue drained by the flush worker; created lazily
+        # since the constructor may run outside any event loop
+        self._file_queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        logger.info("Integration Framework initialized - Code Analysis bound to Holy Tree authority")
+
+    def _ensure_flush_worker(self) -> None:
+        """Start the batching worker on first use inside a running loop."""
+        if self._file_queue is None:
+            self._file_queue = asyncio.Queue(maxsize=4 * _BATCH_MAX)
+            self._flush_task = asyncio.create_task(self._flush_worker())
+
+    async def aclose(self) -> None:
+        """Stop the flush worker (for orderly shutdown in demos and tests)."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+            self._file_queue = None
+
+    async def on_file_closed(self, file_path: str) -> Dict[str, Any]:
+        """Queue a just-closed source file and await its integration result.
+
+        Events are coalesced by the flush worker: a burst of saves becomes
+        one extract-map-register-sync cycle instead of one cycle per file.
+        """
+        self._ensure_flush_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._file_queue.put((file_path, future))
+        return await future
+
+    async def _flush_worker(self) -> None:
+        """Drain queued file events in batches and run one cycle per batch."""
+        while True:
+            batch = [await self._file_queue.get()]
+            while len(batch) < _BATCH_MAX:
+                try:
+                    batch.append(await asyncio.wait_for(
+                        self._file_queue.get(), timeout=_BATCH_WINDOW))
+                except asyncio.TimeoutError:
+                    break
+            await self._process_batch(batch)
+
+    async def _process_batch(self, batch: List[Tuple[str, "asyncio.Future"]]) -> None:
+        """Run a single integration cycle over a batch of closed files."""
+        logger.info("🔄 Processing batch of %d closed file(s)", len(batch))
+
+        try:
+            extractions = await self._extract_batch([file_path for file_path, _ in batch])
+
+            # Union all per-file layer mappings into one registration pass
+            batch_mapping: Dict[str, List[CodeEntity]] = {}
+            per_file = []
+            for (file_path, future), entities in zip(batch, extractions):
+                mapping = await self._map_entities_to_holy_tree(entities)
+                for layer_path, ents in mapping.items():
+                    batch_mapping.setdefault(layer_path, []).extend(ents)
+                per_file.append((future, {
+                    "success": True,
+                    "file_path": file_path,
+                    "entities_extracted": len(entities)
+                }))
+
+            registration_results = await self._register_entities_in_holy_tree(batch_mapping)
+            await self._update_documentation_hyperlinks(batch_mapping)
+            self._update_entity_mappings_cache(batch_mapping)
+            await self._mark_orphaned_entities()
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("   📊 Entities Extracted: %d",
+                            sum(r["entities_extracted"] for _, r in per_file))
+                logger.info("   🏛️ Holy Tree Registered: %d",
+                            registration_results["registered_count"])
+
+            for future, result in per_file:
+                result["holy_tree_registered"] = registration_results["registered_count"]
+                result["created_entities"] = registration_results["created_entities"]
+                result["orphaned_entities"] = len(self.orphaned_entities)
+                if not future.done():
+                    future.set_result(result)
+
+        except Exception as e:
+            logger.error("Integration batch failed: %s", e)
+            for file_path, future in batch:
+                if not future.done():
+                    future.set_result({"success": False, "file_path": file_path, "error": str(e)})
+
+    async def _extract_batch(self, paths: List[str]) -> List[List[CodeEntity]]:
+        """Extract entities from many files concurrently.
+
+        A failure in one file must not sink the whole batch, so exceptions
+        are logged and that file contributes an empty entity list.
+        """
+        extractions = await asyncio.gather(
+            *(self._extract_code_entities(path) for path in paths),
+            return_exceptions=True)
+
+        results: List[List[CodeEntity]] = []
+        for path, extraction in zip(paths, extractions):
+            if isinstance(extraction, BaseException):
+                logger.error("Entity extraction failed for %s: %s", path, extraction)
+                results.append([])
+            else:
+                results.append(extraction)
+        return results
+
+    async def _extract_code_entities(self, file_path: str) -> List[CodeEntity]:
+        """Extract code entities from a file via the Code Analysis MCP.
+
+        Extraction is a pure function of file content, so results are
+        cached on (mtime, size) — an edit-save-close loop that saves
+        without changes skips the detect + extract round-trip entirely.
+        """
+        try:
+            st = await asyncio.to_thread(os.stat, file_path)
+        except OSError:
+            st = None
+        if st is not None:
+            cached = self._extract_cache.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime and cached[1] == st.st_size:
+                return cached[2]
+
+        detection = await self.code_analysis.detect_language({"file_path": file_path})
+        extraction = await self.code_analysis.extract_file_entities({
+            "file_path": file_path,
+            "language": detection["language"]
+        })
+
+        entities = []
+        for row in extraction["entities"]:
+            entities.append(CodeEntity(
+                name=row["name"],
+                type=row["type"],
+                scope=row["scope"],
+                file_path=row["file"],
+                line_number=row["line"]
+            ))
+        if st is not None:
+            self._extract_cache[file_path] = (st.st_mtime, st.st_size, entities)
+        return entities
+
+    async def _map_entities_to_holy_tree(self, entities: List[CodeEntity]) -> Dict[str, List[CodeEntity]]:
+        """Bucket extracted entities by the Holy Tree layer their file lives in."""
+        entity_layer_mapping: Dict[str, List[CodeEntity]] = {}
+        # The layer path is a pure function of the file column, and every
+        # entity extracted from one file shares it — derive it once per
+        # distinct file instead of once per entity
+        file_layer_paths: Dict[str, Optional[str]] = {}
+        for entity in entities:
+            if entity.file_path in file_layer_paths:
+                layer_path = file_layer_paths[entity.file_path]
+            else:
+                parts = self._extract_layer_path_from_file(entity.file_path)
+                layer_path = ".".join(parts) if parts else None
+                file_layer_paths[entity.file_path] = layer_path
+            if layer_path:
+                entity_layer_mapping.setdefault(layer_path, []).append(entity)
+        return entity_layer_mapping
+
+    def _extract_layer_path_from_file(self, file_path: str) -> Optional[Tuple[str, str, str]]:
+        """Derive (domain, object, layer) from a file path under ROMILLM_Project.
+
+        Returned as a tuple so callers that need only one level share the
+        single parse; join with '.' for the canonical layer path.
+        """
+        # All files in one directory share a layer path, so memoize on the
+        # parent directory and skip the path parse on repeat visits
+        dirname = os.path.dirname(file_path)
+        if dirname in self._layer_path_cache:
+            return self._layer_path_cache[dirname]
+
+        layer_parts = self._compute_layer_path(file_path)
+        self._layer_path_cache[dirname] = layer_parts
+        return layer_parts
+
+    def _compute_layer_path(self, file_path: str) -> Optional[Tuple[str, str, str]]:
+        """Uncached layer-path derivation; see _extract_layer_path_from_file."""
+        # One C-level partition instead of materializing Path.parts and
+        # scanning the tuple for the project root; anchored on a separator
+        # so path components merely ending in the name don't match
+        anchor = f"ROMILLM_Project{os.sep}"
+        if file_path.startswith(anchor):
+            after = file_path[len(anchor):]
+        else:
+            _, sep, after = file_path.partition(f"{os.sep}{anchor}")
+            if not sep:
+                return None
+
+        relative = after.split(os.sep, 3)
+        if len(relative) < 3:
+            return None
+
+        domain, object_name, layer = relative[0], relative[1], relative[2]
+        if layer not in _VALID_LAYERS:
+            return None
+        return (domain, object_name, layer)
+
+    async def _register_entities_in_holy_tree(self, entity_layer_mapping: Dict[str, List[CodeEntity]]) -> Dict[str, Any]:
+        """Register every layer group in the Holy Tree concurrently."""
+        # Layer groups are independent, so launch them as one cooperative
+        # batch instead of awaiting each group in turn
+        group_results = await asyncio.gather(*[
+            self._register_layer_entities(layer_path, entities)
+            for layer_path, entities in entity_layer_mapping.items()
+        ])
+
+        registration_results = {"registered_count": 0, "created_entities": []}
+        for partial in group_results:
+            registration_results["registered_count"] += partial["registered_count"]
+            registration_results["created_entities"].extend(partial["created_entities"])
+
+        if registration_results["registered_count"]:
+            self._tree_version += 1
+
+        logger.info("   🏛️ Registered %d entity groups in Holy Tree",
+                    registration_results["registered_count"])
+        return registration_results
+
+    async def _register_layer_entities(self, layer_path: str, entities: List[CodeEntity]) -> Dict[str, Any]:
+        """Register one layer's entities, returning a partial result dict."""
+        results = {"registered_count": 0, "created_entities": []}
+
+        # Group class members/methods under their owning class
+        by_class: Dict[str, List[CodeEntity]] = {}
+        for entity in entities:
+            if entity.type in ("class", "struct"):
+                by_class.setdefault(entity.name, [])
+            elif entity.scope and entity.scope != "global":
+                by_class.setdefault(entity.scope, []).append(entity)
+
+        created = results["created_entities"]
+        for class_name, class_entities_list in by_class.items():
+            # Count methods and members in one pass instead of two
+            # comprehension scans per class
+            method_count = member_count = 0
+            for e in class_entities_list:
+                entity_type = e.type
+                if entity_type in ("method", "function"):
+                    method_count += 1
+                elif entity_type == "member":
+                    member_count += 1
+            prefix = f"{layer_path}.{class_name}"
+            created.append(prefix)
+            created.append(f"{prefix}.methods({method_count})")
+            created.append(f"{prefix}.members({member_count})")
+            results["registered_count"] += 1
+
+        return results
+
+    async def _update_documentation_hyperlinks(self, entity_layer_mapping: Dict[str, List[CodeEntity]]) -> None:
+        """Notify the Documentation MCP that entity structure changed."""
+        if entity_layer_mapping:
+            # One thread dispatch for the whole batch: per-file threadpool
+            # hops cost more than the blocking doc writes they would hide
+            await asyncio.to_thread(self._sync_update_docs, entity_layer_mapping)
+
+    def _sync_update_docs(self, entity_layer_mapping: Dict[str, List[CodeEntity]]) -> None:
+        """Synchronous documentation sync for the whole batch.
+
+        The documentation server watches the tree out of process; this hook
+        exists so in-process markdown edits can be added without touching
+        callers — all reads and writes belong here, off the event loop.
+        """
+        logger.info("   📄 Documentation sync queued for %d layer(s)", len(entity_layer_mapping))
+
+    def _update_entity_mappings_cache(self, entity_layer_mapping: Dict[str, List[CodeEntity]]) -> None:
+        """Record where each extracted entity lives in the Holy Tree."""
+        for layer_path, entities in entity_layer_mapping.items():
+            for entity in entities:
+                entity_id = f"{entity.file_path}::{entity.name}"
+                previous = self.entity_mappings.get(entity_id)
+                if previous is not None and previous.layer_path != layer_path:
+                    # The entity moved layers; drop it from the old shard
+                    shard = self._by_layer_path.get(previous.layer_path)
+                    if shard is not None:
+                        shard.discard(entity_id)
+                        if not shard:
+                            del self._by_layer_path[previous.layer_path]
+                self.entity_mappings[entity_id] = HolyTreeCodeEntityMapping(
+                    code_entity_id=entity_id,
+                    layer_path=layer_path
+                )
+                self._by_layer_path.setdefault(layer_path, set()).add(entity_id)
+
+    async def _mark_orphaned_entities(self) -> None:
+        """Flag mappings whose layer no longer exists in the Holy Tree."""
+        # The layer-path shards let this touch only mappings under stale
+        # layers instead of scanning every mapping on each tree change
+        valid = await self._get_holy_tree_layer_paths()
+        self.orphaned_entities = [
+            entity_id
+            for layer_path, entity_ids in self._by_layer_path.items()
+            if layer_path not in valid
+            for entity_id in entity_ids
+        ]
+        for entity_id in self.orphaned_entities:
+            self.entity_mappings[entity_id].status = "orphaned"
+
+    async def _validate_entity_mapping(self, mapping: HolyTreeCodeEntityMapping) -> bool:
+        """Check that a mapping's layer path still exists in the canon."""
+        return mapping.layer_path in await self._get_holy_tree_layer_paths()
+
+    async def _get_holy_tree_layer_paths(self) -> Set[str]:
+        """Collect every 'Domain.Object.Layer' name path from the Holy Tree."""
+        if self._layer_paths_cache is not None and self._layer_paths_cache[0] == self._tree_version:
+            return self._layer_paths_cache[1]
+
+        layer_paths: Set[str] = set()
+        parser = self.holy_tree.parser
+        if not parser.entities:
+            parser.parse_holy_tree()
+        for entity_number, entity in parser.entities.items():
+            if entity.type == HolyTreeType.LAYER:
+                parts = entity_number.split('.')
+                if len(parts) < 3:
+                    continue
+                domain = parser.get_entity_by_number(parts[0])
+                obj = parser.get_entity_by_number('.'.join(parts[:2]))
+                if domain and obj:
+                    layer_paths.add(f"{domain.name}.{obj.name}.{entity.name}")
+
+        self._layer_paths_cache = (self._tree_version, layer_paths)
+        return layer_paths
+
+    async def analyze_system_impact(self) -> Dict[str, Any]:
+        """Summarize the current code-to-architecture mapping state."""
+        return {
+            "total_mapped_entities": len(self.entity_mappings),
+            # The shard index is maintained incrementally (empty shards are
+            # deleted), so distinct layer paths is an O(1) len
+            "layer_paths_in_use": len(self._by_layer_path),
+            "orphaned_entities": len(self.orphaned_entities),
+            "holy_tree_entities": len(self.holy_tree.parser.entities)
+        }
+
+# Module-level singleton for MCP tool handlers, built on first use so
+# importers don't pay for two MCP servers and a tree parse up front
+integration_framework: Optional[CodeAnalysisHolyTreeIntegration] = None
+
+def _get_integration() -> CodeAnalysisHolyTreeIntegration:
+    global integration_framework
+    if integration_framework is None:
+        integration_framework = CodeAnalysisHolyTreeIntegration()
+    return integration_framework
+
+async def handle_file_closed_integration(file_path: str) -> Dict[str, Any]:
+    """MCP tool entry point for file-closed events."""
+    return await _get_integration().on_file_closed(file_path)
+
+async def get_system_analysis_integration() -> Dict[str, Any]:
+    """MCP tool entry point for system impact analysis."""
+    return await _get_integration().analyze_system_impact()
+
+async def demonstrate_integration():
+    """Demo: close a generated source file and run the integration cycle."""
+    test_file = "ROMILLM_Project/CoreDomain/Tokenizer/Core/tokenizer_core.cpp"
+
+    integration = _get_integration()
+    if os.path.exists(test_file):
+        result = await integration.on_file_closed(test_file)
+        logger.info(f"Integration demo result: {result}")
+    else:
+        logger.info(f"Demo file not found: {test_file} - generate the project structure first")
+
+    await integration.aclose()
+
+if __name__ == "__main__":
+    asyncio.run(demonstrate_integration())